@@ -20,19 +20,25 @@ Requirements:
 """
 
 import json
+import re
 import time
 import sys
 import os
+import queue
+import select
+import atexit
 import argparse
 import traceback
+import threading
+import multiprocessing
 from datetime import datetime
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlparse
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     NoSuchElementException,
@@ -92,6 +98,7 @@ def load_config(profile_path: str) -> dict:
         cfg.setdefault("city_for_forms", loc.split(",")[0].strip() if loc else "Melbourne, Victoria, Australia")
     cfg.setdefault("relevant_title_keywords", cfg.get("keywords", []))
     cfg.setdefault("max_pages_per_keyword", 10)
+    cfg.setdefault("parallel_browsers", 1)
 
     return cfg
 
@@ -100,10 +107,66 @@ def load_config(profile_path: str) -> dict:
 #  LOGGING
 # ──────────────────────────────────────────────
 
+_log_queue = queue.Queue()
+# Writer thread of this process; started on the first log() call.
+_log_thread = None
+_log_thread_lock = threading.Lock()
+
+
+def _log_writer():
+    """Background thread: write queued log lines, one flush per batch."""
+    log_queue = _log_queue
+    while True:
+        lines = [log_queue.get()]
+        while True:
+            try:
+                lines.append(log_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            sys.stdout.write("".join(lines))
+            sys.stdout.flush()
+        except Exception:
+            pass
+        for _ in lines:
+            log_queue.task_done()
+
+
+def _start_log_writer():
+    """Start this process's writer thread if it is not running yet."""
+    global _log_thread
+    with _log_thread_lock:
+        if _log_thread is None or not _log_thread.is_alive():
+            _log_thread = threading.Thread(target=_log_writer, daemon=True)
+            _log_thread.start()
+
+
+def _reset_log_after_fork():
+    """A forked child (e.g. a Pool worker) has no writer thread: start it over with an empty queue."""
+    global _log_queue, _log_thread, _log_thread_lock
+    _log_queue = queue.Queue()
+    _log_thread = None
+    _log_thread_lock = threading.Lock()
+
+
+def flush_log():
+    """Block until every queued log line has been written (no-op if no writer is running)."""
+    if _log_thread is None or not _log_thread.is_alive():
+        return
+    _log_queue.join()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_log_after_fork)
+atexit.register(flush_log)
+
+
 def log(msg: str):
-    """Print a timestamped log message."""
+    """Queue a timestamped log message (written by a background thread, so the bot never blocks on the console)."""
+    if _log_thread is None:
+        _start_log_writer()
     ts = datetime.now().strftime("%H:%M:%S")
-    print(f"[{ts}] {msg}", flush=True)
+    _log_queue.put(f"[{ts}] {msg}\n")
 
 
 def screenshot(driver, label: str = "debug"):
@@ -122,22 +185,75 @@ def screenshot(driver, label: str = "debug"):
 #  BROWSER SETUP
 # ──────────────────────────────────────────────
 
-def create_driver():
-    """Create a visible Chrome browser window."""
+PAGE_LOAD_TIMEOUT = 30  # seconds
+
+
+def create_driver(user_data_dir: str = ""):
+    """Create a visible Chrome browser window (optionally with its own profile dir)."""
     options = Options()
     options.add_argument("--start-maximized")
+    if user_data_dir:
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+    # Hides navigator.webdriver from LinkedIn on current Chrome versions.
     options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
-    driver = webdriver.Chrome(options=options)
-    driver.implicitly_wait(5)
-    # Hide the "automated browser" flag from LinkedIn
-    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-        "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+    # The bot never looks at images (avatars, logos, banners), so don't fetch
+    # them. Stylesheets stay on: is_displayed()/offsetParent checks need layout.
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
     })
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    # Return from driver.get() at DOMContentLoaded instead of waiting for every
+    # tracking/analytics script; the explicit waits cover what we actually need.
+    options.page_load_strategy = "eager"
+    driver = webdriver.Chrome(options=options)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    # No implicit wait: every lookup that needs to wait does so explicitly
+    # via _wait()/_wait_for(), so misses in fallback chains return instantly.
+    driver.implicitly_wait(0)
     return driver
 
 
+def open_url(driver, url: str) -> None:
+    """Navigate to url; if the page is still loading after the timeout, stop it and carry on."""
+    try:
+        driver.get(url)
+    except TimeoutException:
+        log(f"  Page load timed out after {PAGE_LOAD_TIMEOUT}s, continuing with what has loaded.")
+        driver.execute_script("window.stop();")
+
+
+# ──────────────────────────────────────────────
+#  EXPLICIT WAITS
+# ──────────────────────────────────────────────
+
+def _wait(driver, timeout: float = 10) -> WebDriverWait:
+    """Return an explicit wait that polls every 200 ms."""
+    return WebDriverWait(driver, timeout, poll_frequency=0.2)
+
+
+def _wait_for(driver, condition, timeout: float = 10) -> bool:
+    """Wait until condition is truthy. Returns False on timeout instead of raising."""
+    try:
+        _wait(driver, timeout).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+
+def _wait_for_job_cards(driver, timeout: float = 10) -> bool:
+    """Wait until the search results list has rendered at least one job card."""
+    return _wait_for(driver, lambda d: _get_job_cards(d), timeout)
+
+
+def _wait_for_list_refresh(driver, first_card, timeout: float = 3) -> None:
+    """After an action that reloads the results list, wait for the old list to go stale."""
+    if first_card is not None:
+        _wait_for(driver, EC.staleness_of(first_card), timeout)
+    _wait_for_job_cards(driver)
+
+
 # ──────────────────────────────────────────────
 #  JAVASCRIPT HELPERS (more reliable than Selenium clicks)
 # ──────────────────────────────────────────────
@@ -157,17 +273,23 @@ def js_find_and_click_button(driver, button_texts):
     """
     result = driver.execute_script("""
         var texts = arguments[0];
+        // Index visible buttons by text once (first in DOM order wins),
+        // then try the wanted texts in priority order.
+        var byText = new Map();
         var buttons = document.querySelectorAll('button');
+        for (var i = 0; i < buttons.length; i++) {
+            var btn = buttons[i];
+            if (btn.offsetParent === null) continue;
+            var span = btn.querySelector('span');
+            var txt = (span ? span.textContent : btn.textContent).trim();
+            if (!byText.has(txt)) byText.set(txt, btn);
+        }
         for (var t = 0; t < texts.length; t++) {
-            for (var i = 0; i < buttons.length; i++) {
-                var btn = buttons[i];
-                var span = btn.querySelector('span');
-                var txt = (span ? span.textContent : btn.textContent).trim();
-                if (txt === texts[t] && btn.offsetParent !== null) {
-                    btn.scrollIntoView({block: 'center'});
-                    btn.click();
-                    return texts[t];
-                }
+            var match = byText.get(texts[t]);
+            if (match) {
+                match.scrollIntoView({block: 'center'});
+                match.click();
+                return texts[t];
             }
         }
         return '';
@@ -290,14 +412,25 @@ def _click_modal_button_by_keywords(driver) -> str:
 #  LOGIN
 # ──────────────────────────────────────────────
 
+def _on_feed(driver) -> bool:
+    """True on the signed-in feed (path only: the login redirect carries "feed" in its query)."""
+    return urlparse(driver.current_url).path.startswith("/feed")
+
+
 def login(driver):
     """Log into LinkedIn. Handles verification/captcha with manual wait."""
+    # A kept profile (e.g. chrome_profile_worker<slot>) is usually still signed
+    # in: LinkedIn only redirects /feed to the login page when the session is gone.
+    open_url(driver, "https://www.linkedin.com/feed/")
+    if _on_feed(driver):
+        log("Already logged in (saved browser profile).")
+        return
+
     log("Navigating to LinkedIn login...")
-    driver.get("https://www.linkedin.com/login")
-    time.sleep(2)
+    open_url(driver, "https://www.linkedin.com/login")
 
     try:
-        user_field = driver.find_element(By.ID, "username")
+        user_field = _wait(driver).until(EC.presence_of_element_located((By.ID, "username")))
         pass_field = driver.find_element(By.ID, "password")
         user_field.clear()
         user_field.send_keys(CONFIG["linkedin_email"])
@@ -307,21 +440,25 @@ def login(driver):
         submit = driver.find_element(By.XPATH, "//button[@type='submit']")
         submit.click()
         log("Credentials submitted. Waiting for login...")
-        time.sleep(5)
+        _wait_for(driver, EC.any_of(
+            _on_feed,
+            EC.url_contains("checkpoint"),
+            EC.url_contains("challenge"),
+        ), 15)
 
         # Check for verification / CAPTCHA
         if "checkpoint" in driver.current_url or "challenge" in driver.current_url:
             log("*** VERIFICATION REQUIRED ***")
             log("Please complete the CAPTCHA/verification in the browser window.")
-            log("Waiting 60 seconds...")
-            time.sleep(60)
+            log("Waiting up to 60 seconds...")
+            _wait_for(driver, _on_feed, 60)
 
         log(f"Logged in. Current URL: {driver.current_url}")
     except Exception as e:
         log(f"Login issue: {e}")
         screenshot(driver, "login_issue")
-        log("Please log in manually in the browser window. Waiting 30 seconds...")
-        time.sleep(30)
+        log("Please log in manually in the browser window. Waiting up to 30 seconds...")
+        _wait_for(driver, _on_feed, 30)
 
 
 # ──────────────────────────────────────────────
@@ -338,115 +475,189 @@ def build_search_url(keywords: str, location: str) -> str:
     return f"https://www.linkedin.com/jobs/search/?keywords={kw}&location={loc}&f_AL=true&distance={radius}&sortBy=R{start_part}"
 
 
+JOB_CARD_XPATHS = (
+    "//li[@data-occludable-job-id]",
+    "//li[contains(@class,'jobs-search-results__list-item')]",
+    "//div[contains(@class,'job-card-container')]",
+)
+
+
 def _get_job_cards(driver):
     """Get visible job cards across old/new LinkedIn layouts."""
-    selectors = [
-        "//li[@data-occludable-job-id]",
-        "//li[contains(@class,'jobs-search-results__list-item')]",
-        "//div[contains(@class,'job-card-container')]",
-    ]
-    for xp in selectors:
+    for xp in JOB_CARD_XPATHS:
         cards = driver.find_elements(By.XPATH, xp)
         if cards:
             return cards
     return []
 
 
+def _scan_job_cards(driver) -> list:
+    """
+    Read id and text of every job card in one JS call:
+    [{'id': str, 'index': int, 'text': str}, ...]
+    Uses the same layout fallbacks (and so the same indices) as _get_job_cards.
+    """
+    result = driver.execute_script("""
+        var xpaths = arguments[0];
+        var cards = [];
+        for (var x = 0; x < xpaths.length && !cards.length; x++) {
+            var snap = document.evaluate(xpaths[x], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var i = 0; i < snap.snapshotLength; i++) cards.push(snap.snapshotItem(i));
+        }
+        return cards.map(function (card, i) {
+            var text = (card.innerText || '').trim().toLowerCase();
+            var id = (card.getAttribute('data-occludable-job-id') || card.getAttribute('data-job-id') || '').trim();
+            if (!id) {
+                var link = card.querySelector("a[href*='/jobs/view/']");
+                id = (link && link.href) || ('idx:' + i + ':' + text.slice(0, 40));
+            }
+            return {id: id, index: i, text: text};
+        });
+    """, list(JOB_CARD_XPATHS))
+    return result or []
+
+
 def get_easy_apply_jobs(driver) -> list:
     """
     Return job-card indices to process (skips already-applied).
     In filtered searches (f_AL=true), many cards no longer show the literal
     'Easy Apply' text, so treat visible non-applied cards as valid targets.
     """
-    cards = _get_job_cards(driver)
-    jobs = []
-    for i, card in enumerate(cards):
-        try:
-            text = (card.text or "").lower()
-            if _contains_applied_marker(text):
-                continue
-            jobs.append(i)
-        except StaleElementReferenceException:
-            continue
-    return jobs
+    return [rec["index"] for rec in _get_page_job_records(driver)]
 
 
 def _get_page_job_records(driver):
     """
     Return job records for current page:
     [{'id': str, 'index': int, 'text': str}, ...]
+    Skips cards marked as applied and jobs this account already applied to.
     """
-    cards = _get_job_cards(driver)
-    records = []
-    for i, card in enumerate(cards):
-        try:
-            card_text = (card.text or "").strip()
-            lower_text = card_text.lower()
-            if _contains_applied_marker(lower_text):
-                continue
-
-            job_id = (
-                card.get_attribute("data-occludable-job-id")
-                or card.get_attribute("data-job-id")
-                or ""
-            ).strip()
-            if not job_id:
-                try:
-                    link = card.find_element(By.XPATH, ".//a[contains(@href,'/jobs/view/')]")
-                    href = (link.get_attribute("href") or "").strip()
-                    job_id = href or f"idx:{i}:{lower_text[:40]}"
-                except Exception:
-                    job_id = f"idx:{i}:{lower_text[:40]}"
-
-            records.append({
-                "id": job_id,
-                "index": i,
-                "text": lower_text,
-            })
-        except StaleElementReferenceException:
-            continue
-    return records
+    return [
+        rec for rec in _scan_job_cards(driver)
+        if rec["id"] not in APPLIED_IDS and not _contains_applied_marker(rec["text"])
+    ]
 
 
-def click_job_card(driver, index: int):
-    """Click on a job card by index."""
-    cards = _get_job_cards(driver)
-    if index >= len(cards):
-        return False
-    card = cards[index]
+# ──── Applied Job IDs (persisted per account across runs) ────
+
+APPLIED_IDS = set()
+
+
+def _applied_ids_path() -> str:
+    account = re.sub(r"[^\w.-]+", "_", CONFIG.get("linkedin_email", "") or "default")
+    return os.path.join(LOG_DIR, f"applied_ids_{account}.json")
+
+
+def _read_applied_ids_file() -> set:
     try:
-        link = None
-        for xp in [
-            ".//a[contains(@class,'job-card-container__link')]",
-            ".//a[contains(@class,'job-card-list__title')]",
-            ".//a",
-        ]:
-            try:
-                link = card.find_element(By.XPATH, xp)
-                break
-            except NoSuchElementException:
-                continue
-        if link is None:
-            return False
-        js_click(driver, link)
-        time.sleep(2)
-        return True
+        with open(_applied_ids_path(), "r", encoding="utf-8") as f:
+            return set(json.load(f))
+    except FileNotFoundError:
+        return set()
+    except (OSError, ValueError) as e:
+        log(f"Could not read applied job IDs: {e}")
+        return set()
+
+
+def load_applied_ids():
+    """Load job IDs applied to in earlier runs, so they are skipped without opening them."""
+    APPLIED_IDS.update(_read_applied_ids_file())
+    if APPLIED_IDS:
+        log(f"Loaded {len(APPLIED_IDS)} previously applied job IDs.")
+
+
+def remember_applied_id(job_id: str):
+    """Record a successful application and persist it (merged with other processes' writes)."""
+    if not job_id or job_id.startswith("idx:"):
+        return  # position-based fallback ids are not stable across page loads
+    APPLIED_IDS.add(job_id)
+    try:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        path = _applied_ids_path()
+        ids = _read_applied_ids_file() | APPLIED_IDS
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(sorted(ids), f)
+        os.replace(tmp, path)
+    except OSError as e:
+        log(f"Could not save applied job IDs: {e}")
+
+
+CARD_LINK_CSS = (
+    "a[class*='job-card-container__link']",
+    "a[class*='job-card-list__title']",
+    "a",
+)
+
+
+# In priority order: detail-pane heading first, list-card title last.
+JOB_TITLE_CSS = (
+    "h1[class*='t-24']",
+    "h2[class*='job-title']",
+    "a[class*='job-card-list__title']",
+)
+
+
+def click_job_card(driver, job_id: str, index: int = -1) -> bool:
+    """
+    Click a job card, located by the job id from _scan_job_cards (one JS call).
+    Falls back to the card position only for cards without a usable id.
+    """
+    try:
+        clicked_id = driver.execute_script("""
+            var id = arguments[0], index = arguments[1], xpaths = arguments[2], linkCss = arguments[3];
+            var card = null, link = null;
+            if (id && id.indexOf('idx:') !== 0) {
+                var esc = CSS.escape(id);
+                card = document.querySelector('[data-occludable-job-id="' + esc + '"], [data-job-id="' + esc + '"]');
+                if (!card) {
+                    var anchors = document.querySelectorAll("a[href*='/jobs/view/']");
+                    for (var a = 0; a < anchors.length && !link; a++) {
+                        if (anchors[a].href === id) link = anchors[a];
+                    }
+                }
+            }
+            // Position is only trusted for cards that had no stable id: a stable id that
+            // is gone means the list re-rendered, and index would point at another job.
+            var positional = !id || id.indexOf('idx:') === 0;
+            if (positional && !card && !link && index >= 0) {
+                for (var x = 0; x < xpaths.length && !card; x++) {
+                    var snap = document.evaluate(xpaths[x], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                    if (snap.snapshotLength) card = snap.snapshotItem(index);
+                }
+            }
+            for (var c = 0; card && c < linkCss.length && !link; c++) {
+                link = card.querySelector(linkCss[c]);
+            }
+            if (!link) return null;
+            link.scrollIntoView({block: 'center'});
+            link.click();
+            var host = card || link.closest('[data-occludable-job-id]');
+            return (host && host.getAttribute('data-occludable-job-id')) || '';
+        """, job_id, index, list(JOB_CARD_XPATHS), list(CARD_LINK_CSS))
     except Exception:
         return False
+    if clicked_id is None:
+        return False
+    if clicked_id:
+        # The detail pane is loaded once the URL points at this job.
+        _wait_for(driver, EC.url_contains(f"currentJobId={clicked_id}"), 5)
+    else:
+        _wait_for(driver, lambda d: get_job_title(d) != "(unknown title)", 5)
+    return True
 
 
 def get_job_title(driver) -> str:
-    """Get the current job title from the detail pane."""
-    for xp in [
-        "//h1[contains(@class,'t-24')]",
-        "//h2[contains(@class,'job-title')]",
-        "//a[contains(@class,'job-card-list__title')]",
-    ]:
-        try:
-            return driver.find_element(By.XPATH, xp).text.strip()
-        except NoSuchElementException:
-            continue
-    return "(unknown title)"
+    """Get the current job title from the detail pane (one JS call, no waiting)."""
+    title = driver.execute_script("""
+        var selectors = arguments[0];
+        for (var i = 0; i < selectors.length; i++) {
+            var el = document.querySelector(selectors[i]);
+            if (el) return (el.innerText || '').trim();
+        }
+        return '';
+    """, list(JOB_TITLE_CSS))
+    return title or "(unknown title)"
 
 
 def _contains_applied_marker(text: str) -> bool:
@@ -469,57 +680,97 @@ def _is_relevant_title(title: str) -> bool:
 #  EASY APPLY MODAL
 # ──────────────────────────────────────────────
 
+# Attribute-only selectors in one CSS query. Text-based matches ("Easy Apply"
+# in the button text, generic "Apply" buttons) are handled by the JS fallbacks.
+EASY_APPLY_CSS = (
+    "button.jobs-apply-button[aria-label*='easy apply' i], "
+    "button[aria-label*='Easy Apply']"
+)
+
+
 def click_easy_apply_button(driver) -> bool:
     """Find and click the Easy Apply button on the job detail page."""
-    xpaths = [
-        "//button[contains(@class,'jobs-apply-button') and contains(translate(@aria-label, 'EASYAPPLY', 'easyapply'), 'easy apply')]",
-        "//button[contains(@class,'jobs-apply-button') and contains(translate(normalize-space(.), 'EASYAPPLY', 'easyapply'), 'easy apply')]",
-        "//button[contains(@class,'jobs-apply-button') and contains(translate(@aria-label, 'APPLY', 'apply'), 'apply')]",
-        "//button[contains(@aria-label, 'Easy Apply')]",
-        "//button[.//span[contains(text(),'Easy Apply')]]",
-        "//button[contains(@aria-label, 'Apply to')]",
-    ]
     # Let the job details pane finish rendering the action buttons.
-    time.sleep(1)
-    for xp in xpaths:
+    _wait_for(driver, EC.presence_of_element_located((By.CSS_SELECTOR, "button.jobs-apply-button")), 5)
+    for btn in driver.find_elements(By.CSS_SELECTOR, EASY_APPLY_CSS):
         try:
-            btn = WebDriverWait(driver, 4).until(
-                EC.presence_of_element_located((By.XPATH, xp))
-            )
             if btn.is_displayed():
                 js_click(driver, btn)
-                time.sleep(1.5)
+                _wait_for_modal(driver)
                 return True
-        except (NoSuchElementException, TimeoutException):
+        except StaleElementReferenceException:
             continue
 
     # JavaScript fallback
     clicked = js_find_and_click_button(driver, ["Easy Apply"])
     if clicked:
-        time.sleep(1.5)
+        _wait_for_modal(driver)
         return True
     clicked = js_click_first_apply_button(driver)
     if clicked:
         log(f"  JS clicked apply button: {clicked}")
-        time.sleep(1.5)
+        _wait_for_modal(driver)
         return True
     return False
 
 
+def _wait_for_modal(driver, timeout: float = 5) -> bool:
+    """Wait for the Easy Apply modal content to become visible."""
+    return _wait_for(driver, EC.visibility_of_element_located(
+        (By.CSS_SELECTOR, ".jobs-easy-apply-content, .jobs-easy-apply-modal")
+    ), timeout)
+
+
 # ──── Smart Answer Helpers ────
 
+# Label keywords, built once at import (checked for every field of every step).
+YEAR_WORDS = ("year", "experience")
+CITY_WORDS = ("city", "location")
+SALARY_WORDS = ("salary", "pay", "rate", "compensation")
+PHONE_WORDS = ("phone", "mobile")
+URL_WORDS = ("url", "website", "linkedin", "github")
+SPONSOR_WORDS = ("sponsor", "sponsorship", "visa sponsor")
+WORK_AUTH_WORDS = (
+    "authoriz", "authoris", "right to work", "legally", "eligible to work",
+    "work right", "permission to work", "entitled to work",
+    "legally entitled", "valid visa", "work visa", "permanent residen",
+)
+NOTICE_WORDS = ("notice period", "notice")
+START_WORDS = ("start date", "when can you start", "available")
+COVER_LETTER_WORDS = ("cover letter", "why", "interest", "motivation")
+PLACEHOLDER_OPTIONS = ("select", "choose", "please select", "select one", "--", "none", "n/a", "select...", "choose...")
+
+# Text-input field kinds in priority order (first kind found anywhere in the
+# label wins, same as the original if/elif chain). Each alternative is a
+# lookahead, so one regex match classifies a label.
+INPUT_FIELD_KINDS = (
+    ("years", YEAR_WORDS),
+    ("city", CITY_WORDS),
+    ("salary", SALARY_WORDS),
+    ("phone", PHONE_WORDS),
+    ("url", URL_WORDS),
+    ("sponsor", SPONSOR_WORDS),
+    ("work_auth", WORK_AUTH_WORDS),
+    ("notice", NOTICE_WORDS),
+    ("start", START_WORDS),
+)
+FIELD_KIND_RE = re.compile(
+    "|".join(
+        f"(?=.*?(?P<{kind}>{'|'.join(map(re.escape, words))}))"
+        for kind, words in INPUT_FIELD_KINDS
+    ),
+    re.DOTALL,
+)
+
+
 def _is_sponsorship_question(label_text: str) -> bool:
     lbl = label_text.lower()
-    return any(w in lbl for w in ["sponsor", "sponsorship", "visa sponsor"])
+    return any(w in lbl for w in SPONSOR_WORDS)
 
 
 def _is_work_auth_question(label_text: str) -> bool:
     lbl = label_text.lower()
-    return any(w in lbl for w in [
-        "authoriz", "authoris", "right to work", "legally", "eligible to work",
-        "work right", "permission to work", "entitled to work",
-        "legally entitled", "valid visa", "work visa", "permanent residen",
-    ])
+    return any(w in lbl for w in WORK_AUTH_WORDS)
 
 
 def _is_placeholder_option(opt_text: str) -> bool:
@@ -527,10 +778,7 @@ def _is_placeholder_option(opt_text: str) -> bool:
     t = (opt_text or "").strip().lower()
     if not t:
         return True
-    for p in ["select", "choose", "please select", "select one", "--", "none", "n/a", "select...", "choose..."]:
-        if p in t or t == p:
-            return True
-    return False
+    return any(p in t for p in PLACEHOLDER_OPTIONS)
 
 
 def _smart_answer_for_select(label_text: str, options) -> str:
@@ -538,24 +786,24 @@ def _smart_answer_for_select(label_text: str, options) -> str:
     lbl = label_text.lower()
     sponsorship_answer = "no" if not CONFIG.get("requires_sponsorship", False) else "yes"
     work_auth_answer = "yes" if CONFIG.get("work_authorized", True) else "no"
+    opt_texts = [(t or "").strip() for t in options]
 
     if _is_sponsorship_question(lbl):
-        for opt in options:
-            if (opt.text or "").strip().lower() == sponsorship_answer:
-                return opt.text.strip()
+        for t in opt_texts:
+            if t.lower() == sponsorship_answer:
+                return t
 
     if _is_work_auth_question(lbl):
-        for opt in options:
-            if (opt.text or "").strip().lower() == work_auth_answer:
-                return opt.text.strip()
+        for t in opt_texts:
+            if t.lower() == work_auth_answer:
+                return t
 
     # Known: prefer "Yes", then first non-placeholder
-    for opt in options:
-        if (opt.text or "").strip().lower() == "yes":
-            return opt.text.strip()
+    for t in opt_texts:
+        if t.lower() == "yes":
+            return t
 
     # Unknown question: list options and pick first non-placeholder
-    opt_texts = [(opt.text or "").strip() for opt in options]
     valid = [t for t in opt_texts if t and not _is_placeholder_option(t)]
     if valid:
         log(f"    Unknown dropdown '{label_text[:50]}' — options: {opt_texts[:10]}{'...' if len(opt_texts) > 10 else ''}; choosing '{valid[0]}'")
@@ -572,22 +820,92 @@ def _smart_answer_for_radio(label_text: str) -> str:
     return "yes"
 
 
-def _get_label(driver, element) -> str:
-    """Get the label text for a form field."""
-    try:
-        el_id = element.get_attribute("id")
-        if el_id:
-            label = driver.find_element(By.XPATH, f"//label[@for='{el_id}']")
-            return (label.text or "").lower()
-    except Exception:
-        pass
-    try:
-        aria = element.get_attribute("aria-label") or ""
-        if aria:
-            return aria.lower()
-    except Exception:
-        pass
-    return ""
+MODAL_FIELDS_CSS = (
+    "div[class*='jobs-easy-apply'] input, div[class*='jobs-easy-apply'] textarea, "
+    "div[class*='jobs-easy-apply'] select, div[class*='jobs-easy-apply'] fieldset"
+)
+
+
+def _collect_modal_fields(driver) -> list:
+    """
+    Describe every form field in the Easy Apply modal with a single JS call:
+    [{'index', 'tag', 'id', 'label', 'required', 'value', 'options', 'checked', 'autocomplete'}, ...]
+    Radio groups are reported once per <fieldset>, with their radio labels as 'options'.
+    """
+    result = driver.execute_script("""
+        function text(el) { return ((el && (el.innerText || el.textContent)) || '').trim(); }
+        function labelFor(el) {
+            // Native .labels covers label[for=id] and wrapping labels; the
+            // explicit lookups handle fields rendered outside a <form>.
+            var lbl = (el.labels && el.labels[0]) ||
+                (el.id ? document.querySelector('label[for="' + CSS.escape(el.id) + '"]') : null) ||
+                el.closest('label');
+            return (text(lbl) || el.getAttribute('aria-label') || '').toLowerCase();
+        }
+        var nodes = document.querySelectorAll(arguments[0]);
+        var out = [];
+        for (var i = 0; i < nodes.length; i++) {
+            var el = nodes[i];
+            var tag = el.tagName.toLowerCase();
+            var f = {index: i, tag: tag, id: el.id || ''};
+            if (tag === 'fieldset') {
+                var radios = el.querySelectorAll("input[type='radio']");
+                if (!radios.length) continue;
+                var legend = el.querySelector('legend');
+                f.label = (legend ? text(legend) : text(el)).toLowerCase();
+                f.checked = false;
+                f.options = [];
+                for (var r = 0; r < radios.length; r++) {
+                    var radio = radios[r];
+                    if (radio.checked) f.checked = true;
+                    var rl = radio.closest('label') ||
+                        (radio.id ? document.querySelector('label[for="' + CSS.escape(radio.id) + '"]') : null) ||
+                        (radio.parentElement ? radio.parentElement.querySelector('label') : null);
+                    f.options.push(text(rl).toLowerCase());
+                }
+            } else {
+                if (tag === 'input') {
+                    var type = (el.getAttribute('type') || '').toLowerCase();
+                    if (el.hasAttribute('type') && type !== 'text' && type !== 'number') continue;
+                }
+                f.required = el.required || el.getAttribute('aria-required') === 'true';
+                f.value = (el.value || '').trim();
+                f.label = labelFor(el);
+                if (tag === 'select') {
+                    f.options = Array.prototype.map.call(el.options, function (o) { return text(o); });
+                }
+                var role = (el.getAttribute('role') || '').toLowerCase();
+                var auto = (el.getAttribute('aria-autocomplete') || '').toLowerCase();
+                var popup = (el.getAttribute('aria-haspopup') || '').toLowerCase();
+                f.autocomplete = role === 'combobox' || auto === 'list' || auto === 'both' ||
+                    !!(el.getAttribute('aria-controls') || '').trim() || popup === 'listbox' || popup === 'true';
+            }
+            out.push(f);
+        }
+        return JSON.stringify(out);
+    """, MODAL_FIELDS_CSS)
+    return json.loads(result or "[]")
+
+
+def _modal_field_element(driver, field: dict):
+    """Re-locate a field described by _collect_modal_fields (by id, else by position)."""
+    if field.get("id"):
+        return driver.find_element(By.ID, field["id"])
+    return driver.find_elements(By.CSS_SELECTOR, MODAL_FIELDS_CSS)[field["index"]]
+
+
+def _select_option_by_index(driver, field: dict, index: int) -> None:
+    """
+    Choose option `index` of a <select> from _collect_modal_fields in one JS call
+    (Selenium's Select reads every option over the wire before clicking one).
+    """
+    driver.execute_script("""
+        var id = arguments[0], pos = arguments[1], index = arguments[2];
+        var sel = id ? document.getElementById(id) : document.querySelectorAll(arguments[3])[pos];
+        sel.selectedIndex = index;
+        sel.dispatchEvent(new Event('input', {bubbles: true}));
+        sel.dispatchEvent(new Event('change', {bubbles: true}));
+    """, field.get("id", ""), field["index"], index, MODAL_FIELDS_CSS)
 
 
 def _try_select_autocomplete_option(inp):
@@ -595,26 +913,23 @@ def _try_select_autocomplete_option(inp):
     For combobox/autocomplete fields, choose a dropdown suggestion
     after typing text (common in city/location fields).
     """
+    driver = inp.parent
     try:
-        role = (inp.get_attribute("role") or "").lower()
-        aria_auto = (inp.get_attribute("aria-autocomplete") or "").lower()
-        controls = (inp.get_attribute("aria-controls") or "").strip()
-        has_popup = (inp.get_attribute("aria-haspopup") or "").lower()
-
-        is_autocomplete = (
-            role == "combobox"
-            or aria_auto in ("list", "both")
-            or bool(controls)
-            or has_popup in ("listbox", "true")
-        )
-        if not is_autocomplete:
+        # Wait for the suggestion list instead of guessing how long it takes;
+        # without one, ENTER would submit the step with unmatched free text.
+        if not _wait_for(driver, EC.visibility_of_element_located(
+            (By.CSS_SELECTOR, "[role='listbox'] [role='option']")
+        ), 2):
             return False
-
-        time.sleep(0.3)
         inp.send_keys(Keys.ARROW_DOWN)
-        time.sleep(0.15)
+        # Only confirm once a suggestion is actually highlighted.
+        if not _wait_for(driver, lambda d: inp.get_attribute("aria-activedescendant") or d.find_elements(
+            By.CSS_SELECTOR, "[role='listbox'] [role='option'][aria-selected='true']"
+        ), 1):
+            return False
         inp.send_keys(Keys.ENTER)
-        time.sleep(0.2)
+        # The list closes once the choice is taken.
+        _wait_for(driver, EC.invisibility_of_element_located((By.CSS_SELECTOR, "[role='listbox']")), 2)
         return True
     except Exception:
         return False
@@ -622,166 +937,106 @@ def _try_select_autocomplete_option(inp):
 
 # ──── Form Filling ────
 
-def fill_form_fields(driver) -> bool:
-    """Fill all required form fields inside the Easy Apply modal."""
-    filled = False
-    modal = "//div[contains(@class,'jobs-easy-apply')]"
-    years = CONFIG.get("years_of_experience", "5")
-    city = CONFIG.get("city_for_forms", "Melbourne, Victoria, Australia")
-    salary = CONFIG.get("salary_expectation", "120000")
-    phone = CONFIG.get("phone_number", "")
-    profile_url = CONFIG.get("linkedin_profile_url", "")
-    notice = CONFIG.get("notice_period", "2 weeks")
+INPUT_ANSWERS = {
+    "years": lambda: CONFIG.get("years_of_experience", "5"),
+    "city": lambda: CONFIG.get("city_for_forms", "Melbourne, Victoria, Australia"),
+    "salary": lambda: CONFIG.get("salary_expectation", "120000"),
+    "phone": lambda: CONFIG.get("phone_number", "") or "0000000000",
+    "url": lambda: CONFIG.get("linkedin_profile_url", "") or "https://www.linkedin.com/",
+    "sponsor": lambda: "No" if not CONFIG.get("requires_sponsorship") else "Yes",
+    "work_auth": lambda: "Yes" if CONFIG.get("work_authorized") else "No",
+    "notice": lambda: CONFIG.get("notice_period", "2 weeks"),
+    "start": lambda: "Immediately",
+}
+
+
+def _input_answer(label_text: str) -> str:
+    """Answer for a required text/number input, based on its label."""
+    match = FIELD_KIND_RE.match(label_text)
+    # Unknown labels get years of experience: a safe default for numeric fields.
+    return INPUT_ANSWERS[match.lastgroup if match else "years"]()
+
+
+def _textarea_answer(label_text: str) -> str:
+    """Answer for a required free-text field, based on its label."""
     cover_letter = CONFIG.get("cover_letter_text", "")
     default_text = CONFIG.get("default_answer_text", "")
+    if _is_sponsorship_question(label_text):
+        return CONFIG.get("sponsorship_answer_text",
+            "No, I do not require visa sponsorship. I have valid work authorization.")
+    if _is_work_auth_question(label_text):
+        return CONFIG.get("work_auth_answer_text",
+            "Yes, I am legally authorized to work and do not require sponsorship.")
+    if any(w in label_text for w in COVER_LETTER_WORDS):
+        return cover_letter or default_text or "I am excited about this opportunity and believe my skills are a great match."
+    return default_text or "I am experienced and enthusiastic about this role."
+
 
-    # 1) Text / number inputs
+def fill_form_fields(driver) -> bool:
+    """
+    Fill all required form fields inside the Easy Apply modal.
+    Field metadata is read in one round-trip; only fields that need a value
+    are re-located and typed into.
+    """
+    filled = False
     try:
-        inputs = driver.find_elements(By.XPATH, f"{modal}//input[(@type='text' or @type='number' or not(@type))]")
-        for inp in inputs:
-            try:
-                if inp.get_attribute("required") is None and inp.get_attribute("aria-required") != "true":
-                    continue
-                val = (inp.get_attribute("value") or "").strip()
-                if val:
-                    continue
-                label_text = _get_label(driver, inp)
-                inp.clear()
-                if any(w in label_text for w in ["year", "experience"]):
-                    inp.send_keys(years)
-                elif any(w in label_text for w in ["city", "location"]):
-                    inp.send_keys(city)
-                    if _try_select_autocomplete_option(inp):
-                        log("    Selected city/location from dropdown")
-                elif any(w in label_text for w in ["salary", "pay", "rate", "compensation"]):
-                    inp.send_keys(salary)
-                elif any(w in label_text for w in ["phone", "mobile"]):
-                    inp.send_keys(phone or "0000000000")
-                elif any(w in label_text for w in ["url", "website", "linkedin", "github"]):
-                    inp.send_keys(profile_url or "https://www.linkedin.com/")
-                elif _is_sponsorship_question(label_text):
-                    inp.send_keys("No" if not CONFIG.get("requires_sponsorship") else "Yes")
-                elif _is_work_auth_question(label_text):
-                    inp.send_keys("Yes" if CONFIG.get("work_authorized") else "No")
-                elif any(w in label_text for w in ["notice period", "notice"]):
-                    inp.send_keys(notice)
-                elif any(w in label_text for w in ["start date", "when can you start", "available"]):
-                    inp.send_keys("Immediately")
-                else:
-                    inp.send_keys(years)  # safe default for numeric fields
-                # Some LinkedIn text inputs are autocomplete even when label
-                # doesn't explicitly include "city/location".
-                if _try_select_autocomplete_option(inp):
-                    log(f"    Selected dropdown option for '{label_text}'")
-                filled = True
-                log(f"    Filled input '{label_text}'")
-                time.sleep(0.1)
-            except (StaleElementReferenceException, Exception):
-                continue
+        fields = _collect_modal_fields(driver)
     except Exception:
-        pass
+        return False
 
-    # 2) Textareas
-    try:
-        textareas = driver.find_elements(By.XPATH, f"{modal}//textarea")
-        for ta in textareas:
-            try:
-                if ta.get_attribute("required") is None and ta.get_attribute("aria-required") != "true":
-                    continue
-                if (ta.get_attribute("value") or "").strip():
+    for field in fields:
+        tag = field["tag"]
+        label_text = field.get("label", "")
+        try:
+            # 1) Text / number inputs and 2) textareas
+            if tag in ("input", "textarea"):
+                if not field["required"] or field["value"]:
                     continue
-                label_text = _get_label(driver, ta)
-                ta.clear()
-                if _is_sponsorship_question(label_text):
-                    sponsorship_text = CONFIG.get("sponsorship_answer_text",
-                        "No, I do not require visa sponsorship. I have valid work authorization.")
-                    ta.send_keys(sponsorship_text)
-                elif _is_work_auth_question(label_text):
-                    work_auth_text = CONFIG.get("work_auth_answer_text",
-                        "Yes, I am legally authorized to work and do not require sponsorship.")
-                    ta.send_keys(work_auth_text)
-                elif any(w in label_text for w in ["cover letter", "why", "interest", "motivation"]):
-                    ta.send_keys(cover_letter or default_text or "I am excited about this opportunity and believe my skills are a great match.")
+                el = _modal_field_element(driver, field)
+                el.clear()
+                if tag == "input":
+                    el.send_keys(_input_answer(label_text))
+                    # Some LinkedIn text inputs are autocomplete even when label
+                    # doesn't explicitly include "city/location".
+                    if field["autocomplete"] and _try_select_autocomplete_option(el):
+                        log(f"    Selected dropdown option for '{label_text}'")
+                    log(f"    Filled input '{label_text}'")
                 else:
-                    ta.send_keys(default_text or "I am experienced and enthusiastic about this role.")
+                    el.send_keys(_textarea_answer(label_text))
+                    log(f"    Filled textarea '{label_text}'")
                 filled = True
-                log(f"    Filled textarea '{label_text}'")
-                time.sleep(0.1)
-            except Exception:
-                continue
-    except Exception:
-        pass
 
-    # 3) Select dropdowns (<select>)
-    try:
-        selects = driver.find_elements(By.XPATH, f"{modal}//select")
-        for sel in selects:
-            try:
-                select_obj = Select(sel)
-                current = (sel.get_attribute("value") or "").strip()
-                if current:
+            # 3) Select dropdowns (<select>)
+            elif tag == "select":
+                if field["value"]:
                     continue
-                label_text = _get_label(driver, sel)
-                options = list(select_obj.options)
-                opt_texts = [(o.text or "").strip() for o in options]
-                answer = _smart_answer_for_select(label_text, options)
+                opt_texts = field["options"]
+                answer = _smart_answer_for_select(label_text, opt_texts)
                 if answer:
-                    select_obj.select_by_visible_text(answer)
+                    _select_option_by_index(driver, field, opt_texts.index(answer))
                     filled = True
                     log(f"    Selected '{answer}' in dropdown '{label_text}'")
-                elif len(options) > 1:
-                    # First non-placeholder
-                    valid = [t for t in opt_texts if t and not _is_placeholder_option(t)]
-                    if valid:
-                        select_obj.select_by_visible_text(valid[0])
-                        log(f"    Unknown select '{label_text[:40]}' — chose first option: '{valid[0]}'")
-                    else:
-                        select_obj.select_by_index(1)
+                elif len(opt_texts) > 1:
+                    _select_option_by_index(driver, field, 1)
                     filled = True
-                time.sleep(0.1)
-            except Exception:
-                continue
-    except Exception:
-        pass
 
-    # 4) Radio buttons
-    try:
-        fieldsets = driver.find_elements(By.XPATH, f"{modal}//fieldset[.//input[@type='radio']]")
-        for fs in fieldsets:
-            try:
-                radios = fs.find_elements(By.XPATH, ".//input[@type='radio']")
-                if any(r.is_selected() for r in radios):
+            # 4) Radio buttons
+            elif tag == "fieldset":
+                if field["checked"]:
                     continue
-                question_text = ""
-                try:
-                    legend = fs.find_element(By.TAG_NAME, "legend")
-                    question_text = (legend.text or "").lower()
-                except Exception:
-                    question_text = (fs.text or "").lower()
-
-                preferred = _smart_answer_for_radio(question_text)
-                clicked_radio = False
-                for r in radios:
-                    try:
-                        label = r.find_element(By.XPATH, "ancestor::label | following-sibling::label | ../label")
-                        label_txt = (label.text or "").strip().lower()
-                        if label_txt == preferred:
-                            js_click(driver, r)
-                            clicked_radio = True
-                            filled = True
-                            log(f"    Selected '{preferred}' for '{question_text[:60]}'")
-                            break
-                    except Exception:
-                        continue
-                if not clicked_radio and radios:
+                preferred = _smart_answer_for_radio(label_text)
+                radios = _modal_field_element(driver, field).find_elements(By.CSS_SELECTOR, "input[type='radio']")
+                if not radios:
+                    continue
+                if preferred in field["options"]:
+                    js_click(driver, radios[field["options"].index(preferred)])
+                    log(f"    Selected '{preferred}' for '{label_text[:60]}'")
+                else:
                     js_click(driver, radios[0])
-                    filled = True
-                    log(f"    Selected first radio for '{question_text[:60]}'")
-                time.sleep(0.1)
-            except Exception:
-                continue
-    except Exception:
-        pass
+                    log(f"    Selected first radio for '{label_text[:60]}'")
+                filled = True
+        except Exception:
+            continue
 
     return filled
 
@@ -826,7 +1081,6 @@ def process_easy_apply_modal(driver) -> bool:
         filled = fill_form_fields(driver)
         if filled:
             js_scroll_modal(driver)
-            time.sleep(0.3)
 
         # If validation errors are shown, don't click Next — something is missing
         if _has_validation_errors(driver):
@@ -847,12 +1101,17 @@ def process_easy_apply_modal(driver) -> bool:
             break
 
         log(f"    -> Clicked '{clicked}'")
-        time.sleep(1 if "Submit" not in clicked else 1.5)
 
         if "submit" in clicked.lower():
             _handle_post_submit(driver)
             return True
 
+        # Advance as soon as the modal moves to the next step.
+        if current_progress:
+            _wait_for(driver, lambda d: _get_modal_progress(d) != current_progress, 3)
+        else:
+            time.sleep(1)
+
         new_progress = _get_modal_progress(driver)
         if new_progress and new_progress == current_progress:
             stuck_count += 1
@@ -870,11 +1129,13 @@ def process_easy_apply_modal(driver) -> bool:
 
 def _handle_post_submit(driver):
     """Click Done/Dismiss after successful submission."""
-    time.sleep(1)
-    clicked = js_find_and_click_button(driver, ["Done", "Dismiss"])
+    clicked = ""
+    try:
+        clicked = _wait(driver, 5).until(lambda d: js_find_and_click_button(d, ["Done", "Dismiss"]))
+    except TimeoutException:
+        pass
     if clicked:
         log(f"    -> Clicked '{clicked}' (post-submit)")
-    time.sleep(0.5)
 
 
 def _close_modal(driver):
@@ -882,14 +1143,17 @@ def _close_modal(driver):
     try:
         dismiss = driver.find_element(By.XPATH, "//button[@aria-label='Dismiss']")
         js_click(driver, dismiss)
-        time.sleep(0.5)
     except NoSuchElementException:
         return
     try:
-        discard = driver.find_element(By.XPATH, "//button[contains(., 'Discard')]")
+        discard = _wait(driver, 2).until(
+            EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Discard')]"))
+        )
         js_click(driver, discard)
-        time.sleep(0.5)
-    except NoSuchElementException:
+        _wait_for(driver, EC.invisibility_of_element_located(
+            (By.CSS_SELECTOR, ".jobs-easy-apply-modal")
+        ), 3)
+    except TimeoutException:
         pass
 
 
@@ -897,6 +1161,20 @@ def _close_modal(driver):
 #  FILTER HELPERS
 # ──────────────────────────────────────────────
 
+# Pill buttons labelled "Easy Apply" by aria-label; a pill that only says it
+# in its text is found by the js_find_and_click_button fallback.
+EASY_APPLY_FILTER_CSS = (
+    "button.artdeco-pill[aria-label*='Easy Apply'], "
+    "button[aria-label*='Easy Apply filter']"
+)
+
+NEXT_PAGE_XPATHS = (
+    "//button[@aria-label='View next page']",
+    "//button[contains(@aria-label,'next page')]",
+    "//button[contains(@aria-label,'Next')]",
+)
+
+
 def _ensure_easy_apply_filter(driver):
     """Make sure the Easy Apply filter is active on the search page."""
     try:
@@ -906,43 +1184,33 @@ def _ensure_easy_apply_filter(driver):
             log("  Easy Apply filter already active.")
             return
 
-        easy_apply_btns = [
-            "//button[contains(.,'Easy Apply') and contains(@class,'artdeco-pill')]",
-            "//button[contains(@aria-label,'Easy Apply filter')]",
-            "//button[.//span[text()='Easy Apply']]",
-        ]
-        for xp in easy_apply_btns:
-            try:
-                btn = driver.find_element(By.XPATH, xp)
-                if btn.is_displayed():
-                    js_click(driver, btn)
-                    log("  Clicked Easy Apply filter button.")
-                    time.sleep(1)
-                    return
-            except NoSuchElementException:
-                continue
+        cards = _get_job_cards(driver)
+        first_card = cards[0] if cards else None
+        for btn in driver.find_elements(By.CSS_SELECTOR, EASY_APPLY_FILTER_CSS):
+            if btn.is_displayed():
+                js_click(driver, btn)
+                log("  Clicked Easy Apply filter button.")
+                _wait_for_list_refresh(driver, first_card)
+                return
 
         clicked = js_find_and_click_button(driver, ["Easy Apply"])
         if clicked:
             log("  JS clicked Easy Apply filter.")
-            time.sleep(1)
+            _wait_for_list_refresh(driver, first_card)
     except Exception as e:
         log(f"  Could not set Easy Apply filter: {e}")
 
 
 def _go_to_next_results_page(driver) -> bool:
     """Click the next page button in LinkedIn job search results."""
-    next_xpaths = [
-        "//button[@aria-label='View next page']",
-        "//button[contains(@aria-label,'next page')]",
-        "//button[contains(@aria-label,'Next')]",
-    ]
-    for xp in next_xpaths:
+    cards = _get_job_cards(driver)
+    first_card = cards[0] if cards else None
+    for xp in NEXT_PAGE_XPATHS:
         try:
             btn = driver.find_element(By.XPATH, xp)
             if btn.is_displayed() and btn.is_enabled():
                 js_click(driver, btn)
-                time.sleep(2)
+                _wait_for_list_refresh(driver, first_card)
                 return True
         except NoSuchElementException:
             continue
@@ -955,8 +1223,29 @@ def _go_to_next_results_page(driver) -> bool:
 #  MAIN APPLICATION LOOP
 # ──────────────────────────────────────────────
 
-def apply_to_jobs(driver, keyword: str, applied_count: int) -> int:
-    """Search for jobs with a keyword and apply. Returns updated count."""
+def _reserve_application_slot(applied, max_apps: int) -> bool:
+    """Count an application before it is attempted; False once max_apps is taken."""
+    with applied.get_lock():
+        if applied.value >= max_apps:
+            return False
+        applied.value += 1
+        return True
+
+
+def _release_application_slot(applied) -> None:
+    """Give back a slot reserved for an application that was not submitted."""
+    with applied.get_lock():
+        applied.value -= 1
+
+
+def apply_to_jobs(driver, keyword: str, applied) -> int:
+    """
+    Search for jobs with a keyword and apply. Returns the updated total.
+    `applied` is a multiprocessing.Value('i') shared by every browser, so
+    parallel keyword workers stop together once max_applications is reached.
+    A slot is reserved in it before each modal is opened, so concurrent
+    workers can never submit more than max_applications between them.
+    """
     location = CONFIG["location"]
     max_apps = CONFIG.get("max_applications", 50)
     max_pages = int(CONFIG.get("max_pages_per_keyword", 10))
@@ -965,11 +1254,10 @@ def apply_to_jobs(driver, keyword: str, applied_count: int) -> int:
     log(f"\n{'='*60}")
     log(f"Searching: '{keyword}' in {location}")
     log(f"{'='*60}")
-    driver.get(url)
-    time.sleep(2)
+    open_url(driver, url)
+    _wait_for_job_cards(driver)
 
     _ensure_easy_apply_filter(driver)
-    time.sleep(1)
 
     for page_num in range(1, max_pages + 1):
         log(f"Processing results page {page_num}/{max_pages}")
@@ -977,9 +1265,9 @@ def apply_to_jobs(driver, keyword: str, applied_count: int) -> int:
         processed_ids = set()
         no_progress_passes = 0
         while True:
-            if applied_count >= max_apps:
+            if applied.value >= max_apps:
                 log(f"Reached max applications ({max_apps}). Stopping.")
-                return applied_count
+                return applied.value
 
             page_records = _get_page_job_records(driver)
             if not page_records:
@@ -995,15 +1283,14 @@ def apply_to_jobs(driver, keyword: str, applied_count: int) -> int:
                 log(f"Found {len(page_records)} Easy Apply jobs on this page")
             log(f"Pending jobs on this page: {len(pending)}")
 
-            before_attempt_count = applied_count
+            applied_this_pass = 0
             for rec in pending:
                 processed_ids.add(rec["id"])
-                idx = rec["index"]
-                if not click_job_card(driver, idx):
+                if not click_job_card(driver, rec["id"], rec["index"]):
                     continue
 
                 title = get_job_title(driver)
-                log(f"\nJob #{applied_count + 1}: {title}")
+                log(f"\nJob #{applied.value + 1}: {title}")
                 if _contains_applied_marker(title):
                     log("  Skipping: already applied role.")
                     continue
@@ -1011,28 +1298,37 @@ def apply_to_jobs(driver, keyword: str, applied_count: int) -> int:
                     log("  Skipping: non-data role based on title keywords.")
                     continue
 
+                if not _reserve_application_slot(applied, max_apps):
+                    log(f"Reached max applications ({max_apps}). Stopping.")
+                    return applied.value
                 if not click_easy_apply_button(driver):
+                    _release_application_slot(applied)
                     log("  No Easy Apply button found. Skipping.")
                     continue
 
-                success = process_easy_apply_modal(driver)
+                success = False
+                try:
+                    success = process_easy_apply_modal(driver)
+                finally:
+                    if not success:
+                        _release_application_slot(applied)
                 if success:
-                    applied_count += 1
-                    log(f"  *** APPLIED SUCCESSFULLY *** (Total: {applied_count})")
+                    applied_this_pass += 1
+                    remember_applied_id(rec["id"])
+                    log(f"  *** APPLIED SUCCESSFULLY *** (Total: {applied.value})")
                 else:
                     log("  Could not complete application. Skipping.")
 
                 # Return to same results page and continue processing pending jobs.
-                driver.get(current_results_url)
-                time.sleep(2)
+                open_url(driver, current_results_url)
+                _wait_for_job_cards(driver)
                 _ensure_easy_apply_filter(driver)
-                time.sleep(1)
 
-                if applied_count >= max_apps:
+                if applied.value >= max_apps:
                     log(f"Reached max applications ({max_apps}). Stopping.")
-                    return applied_count
+                    return applied.value
 
-            if applied_count == before_attempt_count:
+            if applied_this_pass == 0:
                 no_progress_passes += 1
             else:
                 no_progress_passes = 0
@@ -1048,9 +1344,106 @@ def apply_to_jobs(driver, keyword: str, applied_count: int) -> int:
             log("No next page available. Stopping pagination for this keyword.")
             break
         _ensure_easy_apply_filter(driver)
-        time.sleep(1)
 
-    return applied_count
+    return applied.value
+
+
+# Set in each worker process by _init_keyword_worker().
+_WORKER_APPLIED = None
+_WORKER_SLOT = 0
+
+
+def _init_keyword_worker(config: dict, applied, next_slot) -> None:
+    """Pool initializer: give the worker the profile, the shared counter and a slot number."""
+    global CONFIG, _WORKER_APPLIED, _WORKER_SLOT
+    CONFIG = config
+    _WORKER_APPLIED = applied
+    with next_slot.get_lock():
+        _WORKER_SLOT = next_slot.value
+        next_slot.value += 1
+    load_applied_ids()
+
+
+def _apply_keyword_in_own_browser(keyword: str) -> None:
+    """Worker: open a dedicated Chrome (own profile dir), log in, apply for one keyword."""
+    if _WORKER_APPLIED.value >= CONFIG["max_applications"]:
+        return
+    # Keyed on the worker slot (0..parallel_browsers-1), so the profile and its
+    # LinkedIn login are reused by later keywords and later runs.
+    user_data_dir = os.path.join(LOG_DIR, f"chrome_profile_worker{_WORKER_SLOT}")
+    driver = None
+    try:
+        # Inside the try: a Chrome that fails to start (locked profile, driver
+        # mismatch) must not propagate through pool.map and drop the other keywords.
+        driver = create_driver(user_data_dir)
+        login(driver)
+        apply_to_jobs(driver, keyword, _WORKER_APPLIED)
+    except Exception as e:
+        log(f"\nERROR in worker for '{keyword}': {e}")
+        log(traceback.format_exc())
+        if driver is not None:
+            screenshot(driver, "worker_error")
+    finally:
+        if driver is not None:
+            driver.quit()
+        # Pool workers are terminated, not exited, so atexit won't flush for us.
+        flush_log()
+
+
+def apply_to_keywords_in_parallel(applied) -> int:
+    """Run one Chrome per keyword, at most `parallel_browsers` at a time."""
+    keywords = CONFIG["keywords"]
+    workers = max(1, min(int(CONFIG["parallel_browsers"]), len(keywords), multiprocessing.cpu_count()))
+    log(f"Running {workers} browsers in parallel.")
+    with multiprocessing.Pool(
+        processes=workers,
+        initializer=_init_keyword_worker,
+        initargs=(CONFIG, applied, multiprocessing.Value("i", 0)),
+    ) as pool:
+        pool.map(_apply_keyword_in_own_browser, keywords, chunksize=1)
+    return applied.value
+
+
+def _enter_pressed() -> bool:
+    """Non-blocking check for Enter on an interactive console (consumes the typed line)."""
+    try:
+        if os.name == "nt":
+            import msvcrt
+            pressed = False
+            while msvcrt.kbhit():
+                pressed = msvcrt.getwch() in ("\r", "\n") or pressed
+            return pressed
+        if not sys.stdin or not sys.stdin.isatty():
+            return False  # no console: rely on the window check/timeout
+        # A terminal in line mode only turns readable once Enter is pressed.
+        if select.select([sys.stdin], [], [], 0)[0]:
+            sys.stdin.readline()
+            return True
+    except (OSError, ValueError):
+        pass
+    return False
+
+
+def _wait_for_user_or_browser_close(driver, timeout: float = 300) -> None:
+    """
+    Keep the browser open for inspection until the user presses Enter,
+    closes the browser window, or `timeout` seconds pass. Polls instead of
+    blocking in input(), so nothing is left holding stdin when this returns.
+    """
+    deadline = time.monotonic() + timeout
+    next_window_check = 0.0
+    # Short sleeps keep Ctrl+C responsive on Windows.
+    while time.monotonic() < deadline:
+        if _enter_pressed():
+            return
+        if time.monotonic() >= next_window_check:
+            try:
+                if not driver.window_handles:
+                    return
+            except Exception:
+                return
+            next_window_check = time.monotonic() + 2
+        time.sleep(0.25)
 
 
 def main():
@@ -1084,6 +1477,19 @@ Create a profile JSON file from one of the examples in the profiles/ folder.
     log(f"Max applications: {CONFIG['max_applications']}")
     log("=" * 60)
 
+    load_applied_ids()
+    applied = multiprocessing.Value("i", 0)
+
+    if int(CONFIG["parallel_browsers"]) > 1 and len(CONFIG["keywords"]) > 1:
+        try:
+            applied_count = apply_to_keywords_in_parallel(applied)
+            log(f"\n{'='*60}")
+            log(f"DONE! Applied to {applied_count} jobs.")
+            log(f"{'='*60}")
+        except KeyboardInterrupt:
+            log("\nStopped by user (Ctrl+C).")
+        return
+
     driver = create_driver()
     applied_count = 0
 
@@ -1093,7 +1499,7 @@ Create a profile JSON file from one of the examples in the profiles/ folder.
         for keyword in CONFIG["keywords"]:
             if applied_count >= CONFIG["max_applications"]:
                 break
-            applied_count = apply_to_jobs(driver, keyword, applied_count)
+            applied_count = apply_to_jobs(driver, keyword, applied)
 
         log(f"\n{'='*60}")
         log(f"DONE! Applied to {applied_count} jobs.")
@@ -1106,10 +1512,10 @@ Create a profile JSON file from one of the examples in the profiles/ folder.
         log(traceback.format_exc())
         screenshot(driver, "fatal_error")
     finally:
-        log("Done. Browser stays open for 5 minutes, then closes automatically.")
-        log("You can close it manually or press Ctrl+C to exit now.")
+        log("Done. Browser stays open for up to 5 minutes, then closes automatically.")
+        log("Press Enter, close the browser window, or press Ctrl+C to exit now.")
         try:
-            time.sleep(300)
+            _wait_for_user_or_browser_close(driver, 300)
         except KeyboardInterrupt:
             pass
         driver.quit()
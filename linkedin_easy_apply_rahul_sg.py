@@ -4,21 +4,26 @@ Applies to Easy Apply jobs in Singapore for Data Engineer roles.
 Uses JavaScript clicks for reliability and scrolls modals properly.
 """
 
+import json
+import base64
+import hashlib
+import re
 import time
 import sys
 import os
 import traceback
+import multiprocessing
 from datetime import datetime
-from urllib.parse import quote_plus
+from functools import wraps
+from urllib.parse import quote_plus, urlparse
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
-    NoSuchElementException,
     TimeoutException,
     StaleElementReferenceException,
     ElementClickInterceptedException,
@@ -39,9 +44,54 @@ KEYWORDS = [
 ]
 LOCATION = "Singapore"
 MAX_APPLICATIONS = 50
+MAX_PAGES_PER_KEYWORD = 10
+PARALLEL_BROWSERS = 1  # 1 = sequential; >1 runs one Chrome per keyword, each with its own profile to log in
+HEADLESS = False  # only once the saved profile is logged in (no way to solve a checkpoint)
 
 LOG_DIR = os.path.join(os.path.dirname(__file__), "..", "logs")
 SCREENSHOT_DIR = os.path.join(LOG_DIR, "screenshots")
+# Chrome profile per account, so the LinkedIn session survives between runs.
+PROFILE_DIR = os.path.abspath(os.path.join(LOG_DIR, f"chrome_profile_{USERNAME.split('@')[0]}"))
+
+
+# ──────────────────── LOCATORS ────────────────────
+# CSS wherever possible (native querySelectorAll); XPath only for text matches.
+
+LOGIN_SUBMIT_CSS = (By.CSS_SELECTOR, "button[type='submit']")
+GLOBAL_NAV_ID = (By.ID, "global-nav")
+JOB_CARD_CSS = (By.CSS_SELECTOR, "li[data-occludable-job-id]")
+# Detail-pane title first; the list card title is only a fallback.
+JOB_TITLE_CSS = (
+    "h1.t-24",
+    "h2[class*='job-title']",
+    "a[class*='job-card-list__title']",
+)
+EASY_APPLY_BTN_CSS = (
+    By.CSS_SELECTOR,
+    "button.jobs-apply-button[aria-label*='Easy'], button[aria-label*='Easy Apply']",
+)
+MODAL_CONTENT_CSS = (By.CSS_SELECTOR, "div.jobs-easy-apply-content")
+MODAL_FIELDS_CSS = (
+    "div[class*='jobs-easy-apply'] input, div[class*='jobs-easy-apply'] textarea, "
+    "div[class*='jobs-easy-apply'] select, div[class*='jobs-easy-apply'] fieldset"
+)
+# (locator, current-value attribute, max-value attribute).
+MODAL_PROGRESS_CSS = (
+    ((By.CSS_SELECTOR, "div[class*='jobs-easy-apply'] span[class*='artdeco-completeness']"),
+     "aria-valuenow", "aria-valuemax"),
+    ((By.CSS_SELECTOR, "div[class*='jobs-easy-apply'] progress"), "value", "max"),
+)
+MODAL_HEADER_CSS = (By.CSS_SELECTOR, "div[class*='jobs-easy-apply'] h3")
+FORM_ERROR_CSS = (By.CSS_SELECTOR, "div[class*='artdeco-inline-feedback--error']")
+DISMISS_BTN_CSS = (By.CSS_SELECTOR, "button[aria-label='Dismiss']")
+DISCARD_BTN_XPATH = (By.XPATH, "//button[contains(., 'Discard')]")
+EASY_APPLY_FILTER_ACTIVE_XPATH = (
+    By.XPATH, "//button[contains(@class,'artdeco-pill--selected') and contains(.,'Easy Apply')]")
+EASY_APPLY_FILTER_BTNS = (
+    (By.XPATH, "//button[contains(@class,'artdeco-pill') and contains(.,'Easy Apply')]"),
+    (By.CSS_SELECTOR, "button[aria-label*='Easy Apply filter']"),
+)
+NEXT_PAGE_CSS = (By.CSS_SELECTOR, "button[aria-label='View next page']")
 
 
 # ──────────────────── LOGGING ────────────────────
@@ -51,12 +101,24 @@ def log(msg: str):
     print(f"[{ts}] {msg}", flush=True)
 
 
+_last_shot_hash = [None]
+
+
 def screenshot(driver, label: str = "debug"):
+    """Save a JPEG of the page, unless it looks exactly like the last one saved."""
     try:
+        shot = driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "jpeg", "quality": 40})
+        data = base64.b64decode(shot["data"])
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if digest == _last_shot_hash[0]:
+            log(f"  Screenshot '{label}' skipped (page unchanged).")
+            return
+        _last_shot_hash[0] = digest
         os.makedirs(SCREENSHOT_DIR, exist_ok=True)
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        path = os.path.join(SCREENSHOT_DIR, f"ea_{label}_{ts}.png")
-        driver.save_screenshot(path)
+        path = os.path.join(SCREENSHOT_DIR, f"ea_{label}_{ts}.jpg")
+        with open(path, "wb") as f:
+            f.write(data)
         log(f"  Screenshot: {path}")
     except Exception:
         pass
@@ -64,22 +126,89 @@ def screenshot(driver, label: str = "debug"):
 
 # ──────────────────── BROWSER ────────────────────
 
-def create_driver():
-    """Create a Chrome driver (visible window)."""
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.woff", "*.woff2",
+    "*googletagmanager*", "*platform.linkedin.com/litrk*",
+]
+
+
+def create_driver(user_data_dir: str = ""):
+    """Create a Chrome driver (visible unless HEADLESS), optionally on its own profile directory."""
     options = Options()
-    options.add_argument("--start-maximized")
+    if HEADLESS:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    else:
+        options.add_argument("--start-maximized")
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    if user_data_dir:
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+        options.add_argument("--profile-directory=Default")
     options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
     driver = webdriver.Chrome(options=options)
-    driver.implicitly_wait(5)
+    # Explicit waits only (see _wait); an implicit wait would stack with them.
+    driver.implicitly_wait(0)
     # Remove webdriver flag
     driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
         "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
     })
+    # The bot only reads DOM text and clicks; skip images, fonts and trackers.
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
     return driver
 
 
+# ──────────────────── WAITS ────────────────────
+
+def _wait(driver, timeout: float = 10) -> WebDriverWait:
+    """Explicit wait polling every 200 ms, riding out LinkedIn re-renders."""
+    return WebDriverWait(
+        driver, timeout, poll_frequency=0.2,
+        ignored_exceptions=(StaleElementReferenceException,),
+    )
+
+
+def _wait_for(driver, condition, timeout: float = 10) -> bool:
+    """Wait for condition; return False on timeout instead of raising."""
+    try:
+        _wait(driver, timeout).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+
+def _wait_for_job_list(driver, timeout: float = 10) -> bool:
+    """Wait until the search results list shows job cards."""
+    return _wait_for(driver, EC.presence_of_element_located(JOB_CARD_CSS), timeout)
+
+
+def _promote(items: list, i: int) -> None:
+    """Move items[i] to the front so the selector that matched is tried first next time."""
+    if i:
+        items.insert(0, items.pop(i))
+
+
+def retry_stale(tries: int = 3, delay: float = 0.1):
+    """
+    Retry a function that looks elements up itself when LinkedIn re-renders them
+    mid-call (stale/intercepted), backing off delay, 2*delay, ... Re-raises on the last try.
+    """
+    def deco(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            for attempt in range(tries):
+                try:
+                    return fn(*args, **kwargs)
+                except (StaleElementReferenceException, ElementClickInterceptedException):
+                    if attempt == tries - 1:
+                        raise
+                    time.sleep(delay * (2 ** attempt))
+        return wrapper
+    return deco
+
+
 # ──────────────────── JS HELPERS ────────────────────
 
 def js_click(driver, element):
@@ -94,17 +223,24 @@ def js_find_and_click_button(driver, button_texts):
     """
     result = driver.execute_script("""
         var texts = arguments[0];
+        var wanted = new Set(texts);
+        // One pass over the buttons, keeping the first visible match per text;
+        // then pick by the caller's priority (e.g. Submit before Next).
+        var byText = new Map();
         var buttons = document.querySelectorAll('button');
+        for (var i = 0; i < buttons.length; i++) {
+            var btn = buttons[i];
+            if (btn.offsetParent === null) continue;
+            var span = btn.querySelector('span');
+            var txt = (span ? span.textContent : btn.textContent).trim();
+            if (wanted.has(txt) && !byText.has(txt)) byText.set(txt, btn);
+        }
         for (var t = 0; t < texts.length; t++) {
-            for (var i = 0; i < buttons.length; i++) {
-                var btn = buttons[i];
-                var span = btn.querySelector('span');
-                var txt = (span ? span.textContent : btn.textContent).trim();
-                if (txt === texts[t] && btn.offsetParent !== null) {
-                    btn.scrollIntoView({block: 'center'});
-                    btn.click();
-                    return texts[t];
-                }
+            var match = byText.get(texts[t]);
+            if (match) {
+                match.scrollIntoView({block: 'center'});
+                match.click();
+                return texts[t];
             }
         }
         return '';
@@ -113,56 +249,82 @@ def js_find_and_click_button(driver, button_texts):
 
 
 def js_scroll_modal(driver):
-    """Scroll the Easy Apply modal content to the bottom."""
-    driver.execute_script("""
-        var selectors = [
-            '.jobs-easy-apply-content',
-            '.artdeco-modal__content',
-            '.jobs-easy-apply-modal__content'
-        ];
-        for (var s = 0; s < selectors.length; s++) {
-            var el = document.querySelector(selectors[s]);
-            if (el) {
+    """
+    Scroll the Easy Apply modal content to the bottom and return once the
+    browser has painted it (two animation frames, awaited over CDP).
+    """
+    driver.execute_cdp_cmd("Runtime.evaluate", {
+        "expression": """
+            new Promise(function (resolve) {
+                var selectors = [
+                    '.jobs-easy-apply-content',
+                    '.artdeco-modal__content',
+                    '.jobs-easy-apply-modal__content'
+                ];
+                var el = null;
+                for (var s = 0; s < selectors.length && !el; s++) {
+                    el = document.querySelector(selectors[s]);
+                }
+                if (!el) { resolve(); return; }
                 el.scrollTop = el.scrollHeight;
-                return;
-            }
-        }
-    """)
-    time.sleep(0.2)
+                requestAnimationFrame(function () { requestAnimationFrame(resolve); });
+                // rAF is paused while the window is minimized; don't hang on it.
+                setTimeout(resolve, 200);
+            })
+        """,
+        "awaitPromise": True,
+        "returnByValue": True,
+    })
 
 
 # ──────────────────── LOGIN ────────────────────
 
+def _on_feed(driver):
+    # Match the path only: the login redirect carries "feed" in its query string.
+    return urlparse(driver.current_url).path.startswith("/feed")
+
+
 def login(driver):
+    # A saved profile is usually still signed in: LinkedIn only redirects
+    # /feed to the login page when the session is gone.
+    driver.get("https://www.linkedin.com/feed/")
+    if _on_feed(driver):
+        log("Already logged in (saved browser profile).")
+        return
+
     log("Navigating to LinkedIn login...")
     driver.get("https://www.linkedin.com/login")
-    time.sleep(2)
 
     try:
-        user_field = driver.find_element(By.ID, "username")
+        user_field = _wait(driver).until(EC.presence_of_element_located((By.ID, "username")))
         pass_field = driver.find_element(By.ID, "password")
         user_field.clear()
         user_field.send_keys(USERNAME)
         pass_field.clear()
         pass_field.send_keys(PASSWORD)
 
-        submit = driver.find_element(By.XPATH, "//button[@type='submit']")
+        submit = driver.find_element(*LOGIN_SUBMIT_CSS)
         submit.click()
         log("Credentials submitted. Waiting for login...")
-        time.sleep(5)
+        _wait_for(driver, EC.any_of(
+            _on_feed,
+            EC.presence_of_element_located(GLOBAL_NAV_ID),
+            EC.url_contains("checkpoint"),
+            EC.url_contains("challenge"),
+        ), 15)
 
         # Check for verification/captcha
         if "checkpoint" in driver.current_url or "challenge" in driver.current_url:
             log("*** VERIFICATION REQUIRED - Please complete it in the browser ***")
-            log("Waiting 60 seconds for manual verification...")
-            time.sleep(60)
+            log("Waiting up to 60 seconds for manual verification...")
+            _wait_for(driver, _on_feed, 60)
 
         log(f"Logged in. Current URL: {driver.current_url}")
     except Exception as e:
         log(f"Login issue: {e}")
         screenshot(driver, "login_issue")
-        log("Please log in manually. Waiting 30 seconds...")
-        time.sleep(30)
+        log("Please log in manually. Waiting up to 30 seconds...")
+        _wait_for(driver, _on_feed, 30)
 
 
 # ──────────────────── SEARCH ────────────────────
@@ -173,115 +335,133 @@ def build_search_url(keywords: str, location: str) -> str:
     return f"https://www.linkedin.com/jobs/search/?keywords={kw}&location={loc}&f_AL=true&sortBy=R"
 
 
+# Built once at import; apply_to_jobs and every pool worker just look them up.
+SEARCH_URLS = {kw: build_search_url(kw, LOCATION) for kw in KEYWORDS}
+
+
 def get_easy_apply_jobs(driver) -> list:
-    """Return list of (index, card_text) for Easy Apply jobs not yet applied."""
-    cards = driver.find_elements(By.XPATH, "//li[@data-occludable-job-id]")
-    jobs = []
-    for i, card in enumerate(cards):
-        try:
-            text = (card.text or "").lower()
-            if "applied" in text or "see application" in text:
-                continue
-            if "easy apply" in text:
-                jobs.append(i)
-        except StaleElementReferenceException:
-            continue
-    return jobs
+    """Return indices of Easy Apply job cards not yet applied (all card texts read in one JS call)."""
+    texts = driver.execute_script(
+        "return Array.prototype.map.call(document.querySelectorAll(arguments[0]),"
+        " function (li) { return (li.innerText || '').toLowerCase(); });",
+        JOB_CARD_CSS[1],
+    ) or []
+    return [
+        i for i, text in enumerate(texts)
+        if "easy apply" in text and "applied" not in text and "see application" not in text
+    ]
 
 
+@retry_stale()
 def click_job_card(driver, index: int):
     """Click on a job card by index."""
-    cards = driver.find_elements(By.XPATH, "//li[@data-occludable-job-id]")
+    cards = driver.find_elements(*JOB_CARD_CSS)
     if index >= len(cards):
         return False
     card = cards[index]
     try:
-        link = card.find_element(By.TAG_NAME, "a")
-        js_click(driver, link)
-        time.sleep(1)
+        job_id = card.get_attribute("data-occludable-job-id")
+        links = card.find_elements(By.TAG_NAME, "a")
+        if not links:
+            return False
+        js_click(driver, links[0])
+        # Detail pane follows the URL's currentJobId.
+        _wait_for(driver, EC.url_contains(f"currentJobId={job_id}"), 5)
         return True
+    except StaleElementReferenceException:
+        raise  # card re-rendered; @retry_stale looks it up again
     except Exception:
         return False
 
 
 def get_job_title(driver) -> str:
     """Try to get current job title from the detail pane."""
-    for xp in [
-        "//h1[contains(@class,'t-24')]",
-        "//h2[contains(@class,'job-title')]",
-        "//a[contains(@class,'job-card-list__title')]",
-    ]:
-        try:
-            return driver.find_element(By.XPATH, xp).text.strip()
-        except NoSuchElementException:
-            continue
-    return "(unknown title)"
+    # One round trip; selectors are tried in order (a CSS union would return
+    # whichever matches first in the DOM, i.e. the list card's title).
+    title = driver.execute_script("""
+        var selectors = arguments[0];
+        for (var i = 0; i < selectors.length; i++) {
+            var el = document.querySelector(selectors[i]);
+            if (el) return (el.innerText || '').trim();
+        }
+        return '';
+    """, list(JOB_TITLE_CSS))
+    return title or "(unknown title)"
 
 
 # ──────────────────── EASY APPLY MODAL ────────────────────
 
+@retry_stale()
 def click_easy_apply_button(driver) -> bool:
     """Find and click the Easy Apply button on the job detail page."""
-    xpaths = [
-        "//button[contains(@class,'jobs-apply-button') and contains(@aria-label, 'Easy')]",
-        "//button[contains(@aria-label, 'Easy Apply')]",
-        "//button[.//span[contains(text(),'Easy Apply')]]",
-    ]
-    for xp in xpaths:
-        try:
-            btn = driver.find_element(By.XPATH, xp)
-            if btn.is_displayed():
-                js_click(driver, btn)
-                time.sleep(1.5)
-                return True
-        except NoSuchElementException:
-            continue
+    for btn in driver.find_elements(*EASY_APPLY_BTN_CSS):
+        if btn.is_displayed():
+            js_click(driver, btn)
+            _wait_for_modal(driver)
+            return True
 
-    # JS fallback
+    # JS fallback (matches the button by its text)
     clicked = js_find_and_click_button(driver, ["Easy Apply"])
     if clicked:
-        time.sleep(1.5)
+        _wait_for_modal(driver)
         return True
 
     return False
 
 
+def _wait_for_modal(driver, timeout: float = 5) -> bool:
+    """Wait for the Easy Apply modal content to appear."""
+    return _wait_for(driver, EC.presence_of_element_located(MODAL_CONTENT_CSS), timeout)
+
+
+# Label classifiers: one compiled pattern per question kind instead of
+# any(w in label for w in [...]) scans.
+_YEARS_RE = re.compile(r"year|experience", re.I)
+_CITY_RE = re.compile(r"city|location", re.I)
+_SALARY_RE = re.compile(r"salary|pay|rate|compensation", re.I)
+_PHONE_RE = re.compile(r"phone|mobile", re.I)
+_URL_RE = re.compile(r"url|website|linkedin|github", re.I)
+_SPONSOR_RE = re.compile(r"sponsor", re.I)
+_AUTH_RE = re.compile(
+    r"authori[sz]|right to work|legally|eligible to work|work (?:right|visa)"
+    r"|permission to work|entitled to work|valid visa|permanent residen",
+    re.I,
+)
+_NOTICE_RE = re.compile(r"notice", re.I)
+_START_RE = re.compile(r"start date|when can you start|available", re.I)
+_COVER_RE = re.compile(r"cover letter|why|interest|motivation", re.I)
+
+
 def _is_sponsorship_question(label_text: str) -> bool:
     """Check if a label is asking about visa sponsorship."""
-    lbl = label_text.lower()
-    return any(w in lbl for w in ["sponsor", "sponsorship", "visa sponsor"])
+    return bool(_SPONSOR_RE.search(label_text))
 
 
 def _is_work_auth_question(label_text: str) -> bool:
     """Check if a label is asking about work authorization / right to work."""
-    lbl = label_text.lower()
-    return any(w in lbl for w in [
-        "authoriz", "authoris", "right to work", "legally", "eligible to work",
-        "work right", "permission to work", "entitled to work",
-        "legally entitled", "valid visa", "work visa", "permanent residen",
-    ])
+    return bool(_AUTH_RE.search(label_text))
 
 
 def _smart_answer_for_select(label_text: str, options) -> str:
-    """Pick the best dropdown option based on the question context. Returns option text or empty."""
+    """Pick the best dropdown option (from option texts) based on the question context. Returns option text or empty."""
     lbl = label_text.lower()
 
     # Sponsorship: answer "No" (don't need sponsorship)
     if _is_sponsorship_question(lbl):
         for opt in options:
-            if (opt.text or "").strip().lower() == "no":
-                return opt.text.strip()
+            if opt.strip().lower() == "no":
+                return opt.strip()
 
     # Work authorization: answer "Yes"
     if _is_work_auth_question(lbl):
         for opt in options:
-            if (opt.text or "").strip().lower() == "yes":
-                return opt.text.strip()
+            if opt.strip().lower() == "yes":
+                return opt.strip()
 
     # Default: prefer "Yes", then first non-placeholder option
     for opt in options:
-        if (opt.text or "").strip().lower() == "yes":
-            return opt.text.strip()
+        if opt.strip().lower() == "yes":
+            return opt.strip()
     return ""
 
 
@@ -295,185 +475,201 @@ def _smart_answer_for_radio(label_text: str) -> str:
     return "yes"  # Default: prefer Yes
 
 
-def fill_form_fields(driver) -> bool:
-    """Fill required form fields inside the Easy Apply modal. Returns True if anything filled."""
-    filled = False
-    modal_prefix = "//div[contains(@class,'jobs-easy-apply')]"
+def _collect_modal_fields(driver) -> list:
+    """
+    Describe every form field in the Easy Apply modal with a single JS call:
+    [{'index', 'tag', 'label', 'required', 'value', 'options', 'checked'}, ...]
+    Radio groups are reported once per <fieldset>, with their radio labels as 'options'.
+    """
+    result = driver.execute_script("""
+        function text(el) { return ((el && (el.innerText || el.textContent)) || '').trim(); }
+        // One pass over the modal's labels instead of a lookup per field.
+        var labels = {};
+        document.querySelectorAll("div[class*='jobs-easy-apply'] label[for]").forEach(function (l) {
+            var key = l.getAttribute('for');
+            if (!(key in labels)) labels[key] = text(l).toLowerCase();
+        });
+        function labelFor(el) {
+            return (el.id && labels[el.id]) || (el.getAttribute('aria-label') || '').toLowerCase();
+        }
+        var nodes = document.querySelectorAll(arguments[0]);
+        var out = [];
+        for (var i = 0; i < nodes.length; i++) {
+            var el = nodes[i];
+            var tag = el.tagName.toLowerCase();
+            var f = {index: i, tag: tag};
+            if (tag === 'fieldset') {
+                var radios = el.querySelectorAll("input[type='radio']");
+                if (!radios.length) continue;
+                var legend = el.querySelector('legend');
+                f.label = (legend ? text(legend) : text(el)).toLowerCase();
+                f.checked = false;
+                f.options = [];
+                for (var r = 0; r < radios.length; r++) {
+                    var radio = radios[r];
+                    if (radio.checked) f.checked = true;
+                    var rl = radio.closest('label');
+                    if (!rl && radio.id && labels[radio.id]) { f.options.push(labels[radio.id]); continue; }
+                    if (!rl && radio.parentElement) rl = radio.parentElement.querySelector('label');
+                    f.options.push(text(rl).toLowerCase());
+                }
+            } else {
+                if (tag === 'input') {
+                    var type = (el.getAttribute('type') || '').toLowerCase();
+                    if (el.hasAttribute('type') && type !== 'text' && type !== 'number') continue;
+                }
+                f.required = el.required || el.getAttribute('aria-required') === 'true';
+                f.value = (el.value || '').trim();
+                f.label = labelFor(el);
+                if (tag === 'select') {
+                    f.options = Array.prototype.map.call(el.options, function (o) { return text(o); });
+                }
+            }
+            out.push(f);
+        }
+        return JSON.stringify(out);
+    """, MODAL_FIELDS_CSS)
+    return json.loads(result or "[]")
 
-    # 1) Text/number inputs
-    try:
-        inputs = driver.find_elements(By.XPATH, f"{modal_prefix}//input[(@type='text' or @type='number' or not(@type))]")
-        for inp in inputs:
-            try:
-                if inp.get_attribute("required") is None and inp.get_attribute("aria-required") != "true":
-                    continue
-                val = (inp.get_attribute("value") or "").strip()
-                if val:
-                    continue
-                label_text = _get_label(driver, inp)
-                inp.clear()
-                if any(w in label_text for w in ["year", "experience"]):
-                    inp.send_keys("5")
-                elif any(w in label_text for w in ["city", "location"]):
-                    inp.send_keys("Singapore")
-                elif any(w in label_text for w in ["salary", "pay", "rate", "compensation"]):
-                    inp.send_keys("120000")
-                elif any(w in label_text for w in ["phone", "mobile"]):
-                    inp.send_keys("0434973771")
-                elif any(w in label_text for w in ["url", "website", "linkedin", "github"]):
-                    inp.send_keys("https://www.linkedin.com/in/rahulpoolanchalil/")
-                elif _is_sponsorship_question(label_text):
-                    inp.send_keys("No")
-                elif _is_work_auth_question(label_text):
-                    inp.send_keys("Yes")
-                elif any(w in label_text for w in ["notice period", "notice"]):
-                    inp.send_keys("2 weeks")
-                elif any(w in label_text for w in ["start date", "when can you start", "available"]):
-                    inp.send_keys("Immediately")
-                else:
-                    inp.send_keys("5")
-                filled = True
-                log(f"    Filled input '{label_text}'")
-                time.sleep(0.1)
-            except (StaleElementReferenceException, Exception):
-                continue
-    except Exception:
-        pass
 
-    # 2) Textareas
-    try:
-        textareas = driver.find_elements(By.XPATH, f"{modal_prefix}//textarea")
-        for ta in textareas:
-            try:
-                if ta.get_attribute("required") is None and ta.get_attribute("aria-required") != "true":
-                    continue
-                if (ta.get_attribute("value") or "").strip():
-                    continue
-                label_text = _get_label(driver, ta)
-                ta.clear()
-                if _is_sponsorship_question(label_text):
-                    ta.send_keys("No, I do not require visa sponsorship. I have valid work authorization and can start immediately.")
-                elif _is_work_auth_question(label_text):
-                    ta.send_keys("Yes, I am legally authorized to work and do not require sponsorship.")
-                elif any(w in label_text for w in ["cover letter", "why", "interest", "motivation"]):
-                    ta.send_keys("I have 5+ years of experience in data engineering with expertise in Python, SQL, Spark, Airflow, and cloud platforms (AWS/GCP/Azure). I do not require sponsorship and can start immediately. I am keen to contribute to your team.")
-                else:
-                    ta.send_keys("I have 5+ years of experience in data engineering with expertise in Python, SQL, Spark, Airflow, and cloud platforms (AWS/GCP/Azure). I do not require sponsorship and am available to start immediately.")
-                filled = True
-                log(f"    Filled textarea '{label_text}'")
-                time.sleep(0.1)
-            except Exception:
-                continue
-    except Exception:
-        pass
+def _write_modal_fields(driver, writes: list) -> None:
+    """
+    Apply [[index, value], ...] to the fields from _collect_modal_fields in one JS call.
+    value is text for inputs/textareas, the option index for selects and the radio
+    position for fieldsets.
+    """
+    driver.execute_script("""
+        // Native value setters: assigning el.value directly is swallowed by
+        // React-controlled inputs, which track the last value they set.
+        var setInput = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+        var setTextarea = Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, 'value').set;
+        var nodes = document.querySelectorAll(arguments[0]);
+        var writes = arguments[1];
+        for (var w = 0; w < writes.length; w++) {
+            var el = nodes[writes[w][0]], value = writes[w][1];
+            if (!el) continue;
+            var tag = el.tagName.toLowerCase();
+            if (tag === 'fieldset') {
+                var radio = el.querySelectorAll("input[type='radio']")[value];
+                if (radio) radio.click();
+                continue;
+            }
+            if (tag === 'select') el.selectedIndex = value;
+            else if (tag === 'textarea') setTextarea.call(el, value);
+            else setInput.call(el, value);
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+    """, MODAL_FIELDS_CSS, writes)
+
+
+# (label pattern, answer) in priority order; the first pattern found in the label wins.
+FIELD_RULES = (
+    (_YEARS_RE, "5"),
+    (_CITY_RE, "Singapore"),
+    (_SALARY_RE, "120000"),
+    (_PHONE_RE, "0434973771"),
+    (_URL_RE, "https://www.linkedin.com/in/rahulpoolanchalil/"),
+    (_SPONSOR_RE, "No"),
+    (_AUTH_RE, "Yes"),
+    (_NOTICE_RE, "2 weeks"),
+    (_START_RE, "Immediately"),
+)
+FIELD_DEFAULT = "5"
 
-    # 3) Select dropdowns
-    try:
-        selects = driver.find_elements(By.XPATH, f"{modal_prefix}//select")
-        for sel in selects:
-            try:
-                select_obj = Select(sel)
-                current = (sel.get_attribute("value") or "").strip()
-                if current:
-                    continue
-                label_text = _get_label(driver, sel)
-                options = select_obj.options
-
-                # Smart answer based on question context
-                answer = _smart_answer_for_select(label_text, options)
-                if answer:
-                    select_obj.select_by_visible_text(answer)
-                    filled = True
-                    log(f"    Selected '{answer}' in dropdown '{label_text}'")
-                elif len(options) > 1:
-                    select_obj.select_by_index(1)
-                    filled = True
-                    log(f"    Selected first option in dropdown '{label_text}'")
-                time.sleep(0.1)
-            except Exception:
-                continue
-    except Exception:
-        pass
+TEXTAREA_RULES = (
+    (_SPONSOR_RE, "No, I do not require visa sponsorship. I have valid work authorization and can start immediately."),
+    (_AUTH_RE, "Yes, I am legally authorized to work and do not require sponsorship."),
+    (_COVER_RE, "I have 5+ years of experience in data engineering with expertise in Python, SQL, Spark, Airflow, and cloud platforms (AWS/GCP/Azure). I do not require sponsorship and can start immediately. I am keen to contribute to your team."),
+)
+TEXTAREA_DEFAULT = "I have 5+ years of experience in data engineering with expertise in Python, SQL, Spark, Airflow, and cloud platforms (AWS/GCP/Azure). I do not require sponsorship and am available to start immediately."
 
-    # 4) Radio buttons
-    try:
-        fieldsets = driver.find_elements(By.XPATH, f"{modal_prefix}//fieldset[.//input[@type='radio']]")
-        for fs in fieldsets:
-            try:
-                radios = fs.find_elements(By.XPATH, ".//input[@type='radio']")
-                if any(r.is_selected() for r in radios):
-                    continue
-                # Get the fieldset question text
-                question_text = ""
-                try:
-                    legend = fs.find_element(By.TAG_NAME, "legend")
-                    question_text = (legend.text or "").lower()
-                except Exception:
-                    question_text = (fs.text or "").lower()
 
-                preferred = _smart_answer_for_radio(question_text)
+def _input_answer(label_text: str) -> str:
+    """Answer for a required text/number input, chosen from its label."""
+    return next((answer for pattern, answer in FIELD_RULES if pattern.search(label_text)), FIELD_DEFAULT)
 
-                clicked_radio = False
-                for r in radios:
-                    try:
-                        label = r.find_element(By.XPATH, "ancestor::label | following-sibling::label | ../label")
-                        label_txt = (label.text or "").strip().lower()
-                        if label_txt == preferred:
-                            js_click(driver, r)
-                            clicked_radio = True
-                            filled = True
-                            log(f"    Selected '{preferred}' for '{question_text[:60]}'")
-                            break
-                    except Exception:
-                        continue
-                if not clicked_radio and radios:
-                    js_click(driver, radios[0])
-                    filled = True
-                    log(f"    Selected first radio for '{question_text[:60]}'")
-                time.sleep(0.1)
-            except Exception:
-                continue
-    except Exception:
-        pass
 
-    return filled
+def _textarea_answer(label_text: str) -> str:
+    """Answer for a required textarea, chosen from its label."""
+    return next((answer for pattern, answer in TEXTAREA_RULES if pattern.search(label_text)), TEXTAREA_DEFAULT)
 
 
-def _get_label(driver, element) -> str:
-    """Get label text for a form field."""
+def fill_form_fields(driver) -> bool:
+    """
+    Fill required form fields inside the Easy Apply modal. Returns True if anything filled.
+    Fields are read in one JS call and all answers written back in another.
+    """
     try:
-        el_id = element.get_attribute("id")
-        if el_id:
-            label = driver.find_element(By.XPATH, f"//label[@for='{el_id}']")
-            return (label.text or "").lower()
-    except Exception:
-        pass
+        fields = _collect_modal_fields(driver)
+    except Exception as e:
+        log(f"    Could not read form fields: {e}")
+        return False
+
+    writes = []
+    for field in fields:
+        tag, label_text = field["tag"], field["label"]
+
+        # Radio buttons
+        if tag == "fieldset":
+            if field["checked"]:
+                continue
+            preferred = _smart_answer_for_radio(label_text)
+            if preferred in field["options"]:
+                writes.append([field["index"], field["options"].index(preferred)])
+                log(f"    Selected '{preferred}' for '{label_text[:60]}'")
+            else:
+                writes.append([field["index"], 0])
+                log(f"    Selected first radio for '{label_text[:60]}'")
+
+        # Select dropdowns
+        elif tag == "select":
+            if field["value"]:
+                continue
+            options = field["options"]
+            answer = _smart_answer_for_select(label_text, options)
+            if answer:
+                writes.append([field["index"], [o.strip() for o in options].index(answer)])
+                log(f"    Selected '{answer}' in dropdown '{label_text}'")
+            elif len(options) > 1:
+                writes.append([field["index"], 1])
+                log(f"    Selected first option in dropdown '{label_text}'")
+
+        # Text/number inputs and textareas
+        elif field["required"] and not field["value"]:
+            if tag == "textarea":
+                writes.append([field["index"], _textarea_answer(label_text)])
+                log(f"    Filled textarea '{label_text}'")
+            else:
+                writes.append([field["index"], _input_answer(label_text)])
+                log(f"    Filled input '{label_text}'")
+
+    if not writes:
+        return False
     try:
-        aria = element.get_attribute("aria-label") or ""
-        if aria:
-            return aria.lower()
-    except Exception:
-        pass
-    return ""
+        _write_modal_fields(driver, writes)
+    except Exception as e:
+        log(f"    Could not fill form fields: {e}")
+        return False
+    return True
+
+
+# MODAL_PROGRESS_CSS in try order: the entry that matched last is moved to the front (see _promote).
+_modal_progress_order = list(MODAL_PROGRESS_CSS)
 
 
 def _get_modal_progress(driver) -> str:
     """Get the current progress indicator text from the Easy Apply modal (e.g. 'Step 2 of 5')."""
     try:
-        progress = driver.find_element(By.XPATH, "//div[contains(@class,'jobs-easy-apply')]//span[contains(@class,'artdeco-completeness')]")
-        return (progress.get_attribute("aria-valuenow") or "") + "/" + (progress.get_attribute("aria-valuemax") or "")
-    except Exception:
-        pass
-    try:
-        progress = driver.find_element(By.XPATH, "//div[contains(@class,'jobs-easy-apply')]//progress")
-        return (progress.get_attribute("value") or "") + "/" + (progress.get_attribute("max") or "")
-    except Exception:
-        pass
-    # Fallback: grab the modal header text
-    try:
-        header = driver.find_element(By.XPATH, "//div[contains(@class,'jobs-easy-apply')]//h3")
-        return header.text.strip()
-    except Exception:
+        for i, (locator, now_attr, max_attr) in enumerate(_modal_progress_order):
+            progress = driver.find_elements(*locator)
+            if progress:
+                _promote(_modal_progress_order, i)
+                return (progress[0].get_attribute(now_attr) or "") + "/" + (progress[0].get_attribute(max_attr) or "")
+        # Fallback (never cached: the header can stay the same across steps)
+        header = driver.find_elements(*MODAL_HEADER_CSS)
+        return header[0].text.strip() if header else ""
+    except StaleElementReferenceException:
         return ""
 
 
@@ -508,7 +704,6 @@ def process_easy_apply_modal(driver) -> bool:
         clicked = js_find_and_click_button(driver, SUBMIT_TEXTS)
         if clicked:
             log(f"    -> Clicked '{clicked}'")
-            time.sleep(1.5)
             _handle_post_submit(driver)
             return True
 
@@ -516,7 +711,11 @@ def process_easy_apply_modal(driver) -> bool:
         clicked = js_find_and_click_button(driver, NEXT_TEXTS)
         if clicked:
             log(f"    -> Clicked '{clicked}'")
-            time.sleep(1)
+            # Move on as soon as the modal shows the next step.
+            if current_progress:
+                _wait_for(driver, lambda d: _get_modal_progress(d) != current_progress, 3)
+            else:
+                time.sleep(1)
 
             # Check if progress actually changed (detect stuck loops)
             new_progress = _get_modal_progress(driver)
@@ -528,7 +727,7 @@ def process_easy_apply_modal(driver) -> bool:
                     screenshot(driver, f"step{step+1}_stuck")
                     # Check errors
                     try:
-                        errors = driver.find_elements(By.XPATH, "//div[contains(@class,'artdeco-inline-feedback--error')]")
+                        errors = driver.find_elements(*FORM_ERROR_CSS)
                         visible_errors = [e.text for e in errors if e.is_displayed() and e.text.strip()]
                         if visible_errors:
                             log(f"    Validation errors: {visible_errors}")
@@ -546,7 +745,7 @@ def process_easy_apply_modal(driver) -> bool:
         screenshot(driver, f"step{step+1}_no_button")
 
         try:
-            errors = driver.find_elements(By.XPATH, "//div[contains(@class,'artdeco-inline-feedback--error')]")
+            errors = driver.find_elements(*FORM_ERROR_CSS)
             visible_errors = [e.text for e in errors if e.is_displayed() and e.text.strip()]
             if visible_errors:
                 log(f"    Validation errors: {visible_errors}")
@@ -563,113 +762,214 @@ def process_easy_apply_modal(driver) -> bool:
 
 def _handle_post_submit(driver):
     """Click Done/Dismiss after successful submission."""
-    time.sleep(1)
-    clicked = js_find_and_click_button(driver, ["Done", "Dismiss"])
+    clicked = ""
+    try:
+        clicked = _wait(driver, 5).until(lambda d: js_find_and_click_button(d, ["Done", "Dismiss"]))
+    except TimeoutException:
+        pass
     if clicked:
         log(f"    -> Clicked '{clicked}' (post-submit)")
-    time.sleep(0.5)
 
 
 def _close_modal(driver):
     """Close the Easy Apply modal (dismiss + discard if needed)."""
-    try:
-        dismiss = driver.find_element(By.XPATH, "//button[@aria-label='Dismiss']")
-        js_click(driver, dismiss)
-        time.sleep(0.5)
-    except NoSuchElementException:
+    dismiss = driver.find_elements(*DISMISS_BTN_CSS)
+    if not dismiss:
         return
+    js_click(driver, dismiss[0])
     try:
-        discard = driver.find_element(By.XPATH, "//button[contains(., 'Discard')]")
+        discard = _wait(driver, 2).until(
+            EC.element_to_be_clickable(DISCARD_BTN_XPATH))
         js_click(driver, discard)
-        time.sleep(0.5)
-    except NoSuchElementException:
+        _wait_for(driver, EC.invisibility_of_element_located(MODAL_CONTENT_CSS), 3)
+    except TimeoutException:
         pass
 
 
 # ──────────────────── MAIN LOOP ────────────────────
 
+def _wait_for_list_refresh(driver, first_card, timeout: float = 3) -> None:
+    """Wait for the results list to be replaced, then for the new cards."""
+    if first_card is not None:
+        _wait_for(driver, EC.staleness_of(first_card), timeout)
+    _wait_for_job_list(driver)
+
+
 def _ensure_easy_apply_filter(driver):
     """Click the Easy Apply filter button if it's not already active."""
     try:
         # Check if Easy Apply filter pill is already selected
-        active = driver.find_elements(By.XPATH,
-            "//button[contains(@class,'artdeco-pill--selected') and contains(.,'Easy Apply')]")
+        active = driver.find_elements(*EASY_APPLY_FILTER_ACTIVE_XPATH)
         if active:
             log("  Easy Apply filter already active.")
             return
 
+        # The list re-renders after the filter click; wait for the old one to go stale.
+        cards = driver.find_elements(*JOB_CARD_CSS)
+        first_card = cards[0] if cards else None
+
         # Try clicking the Easy Apply filter button/pill
-        easy_apply_btns = [
-            "//button[contains(.,'Easy Apply') and contains(@class,'artdeco-pill')]",
-            "//button[contains(@aria-label,'Easy Apply filter')]",
-            "//button[.//span[text()='Easy Apply']]",
-        ]
-        for xp in easy_apply_btns:
-            try:
-                btn = driver.find_element(By.XPATH, xp)
+        for locator in EASY_APPLY_FILTER_BTNS:
+            for btn in driver.find_elements(*locator):
                 if btn.is_displayed():
                     js_click(driver, btn)
                     log("  Clicked Easy Apply filter button.")
-                    time.sleep(1)
+                    _wait_for_list_refresh(driver, first_card)
                     return
-            except NoSuchElementException:
-                continue
 
         # JS fallback
         clicked = js_find_and_click_button(driver, ["Easy Apply"])
         if clicked:
             log("  JS clicked Easy Apply filter.")
-            time.sleep(1)
+            _wait_for_list_refresh(driver, first_card)
     except Exception as e:
         log(f"  Could not set Easy Apply filter: {e}")
 
 
-def apply_to_jobs(driver, keyword: str, applied_count: int) -> int:
-    """Search for jobs with a keyword and apply. Returns updated applied count."""
-    url = build_search_url(keyword, LOCATION)
+def _go_to_next_results_page(driver) -> bool:
+    """Click the results pagination 'Next' button and wait for the new cards."""
+    cards = driver.find_elements(*JOB_CARD_CSS)
+    first_card = cards[0] if cards else None
+    for btn in driver.find_elements(*NEXT_PAGE_CSS):
+        try:
+            if btn.is_displayed() and btn.is_enabled():
+                js_click(driver, btn)
+                _wait_for_list_refresh(driver, first_card)
+                return True
+        except StaleElementReferenceException:
+            continue
+    return False
+
+
+def _reserve_application_slot(applied) -> bool:
+    """Count an application before it is attempted; False once MAX_APPLICATIONS is taken."""
+    with applied.get_lock():
+        if applied.value >= MAX_APPLICATIONS:
+            return False
+        applied.value += 1
+        return True
+
+
+def _release_application_slot(applied) -> None:
+    """Give back a slot reserved for an application that was not submitted."""
+    with applied.get_lock():
+        applied.value -= 1
+
+
+def apply_to_jobs(driver, keyword: str, applied) -> int:
+    """
+    Search for jobs with a keyword and apply. Returns updated applied count.
+    The search page is loaded once; jobs open in the detail pane and further
+    results come from the pagination button, so nothing is reloaded per job.
+    `applied` is a multiprocessing.Value('i') shared by all browsers; a slot
+    is reserved in it before each modal is opened, so the MAX_APPLICATIONS cap
+    holds across parallel keyword workers.
+    """
+    url = SEARCH_URLS.get(keyword) or build_search_url(keyword, LOCATION)
     log(f"\n{'='*60}")
     log(f"Searching: '{keyword}' in {LOCATION}")
     log(f"{'='*60}")
     driver.get(url)
-    time.sleep(2)
+    _wait_for_job_list(driver)
 
     # Ensure Easy Apply filter is active
     _ensure_easy_apply_filter(driver)
-    time.sleep(1)
 
-    job_indices = get_easy_apply_jobs(driver)
-    log(f"Found {len(job_indices)} Easy Apply jobs on this page")
+    for page_num in range(1, MAX_PAGES_PER_KEYWORD + 1):
+        job_indices = get_easy_apply_jobs(driver)
+        log(f"Found {len(job_indices)} Easy Apply jobs on page {page_num}")
 
-    for idx in job_indices:
-        if applied_count >= MAX_APPLICATIONS:
-            log(f"Reached max applications ({MAX_APPLICATIONS}). Stopping.")
-            return applied_count
+        for idx in job_indices:
+            if not _reserve_application_slot(applied):
+                log(f"Reached max applications ({MAX_APPLICATIONS}). Stopping.")
+                return applied.value
 
-        if not click_job_card(driver, idx):
-            continue
+            try:
+                if not click_job_card(driver, idx):
+                    _release_application_slot(applied)
+                    continue
 
-        title = get_job_title(driver)
-        log(f"\nJob #{applied_count + 1}: {title}")
+                title = get_job_title(driver)
+                log(f"\nJob #{applied.value}: {title}")
 
-        if not click_easy_apply_button(driver):
-            log(f"  No Easy Apply button found. Skipping.")
-            continue
+                if not click_easy_apply_button(driver):
+                    _release_application_slot(applied)
+                    log(f"  No Easy Apply button found. Skipping.")
+                    continue
+            except (StaleElementReferenceException, ElementClickInterceptedException):
+                _release_application_slot(applied)
+                log(f"  Job card kept re-rendering. Skipping.")
+                continue
+
+            success = False
+            try:
+                success = process_easy_apply_modal(driver)
+            finally:
+                if not success:
+                    _release_application_slot(applied)
+            if success:
+                log(f"  *** APPLIED SUCCESSFULLY *** (Total: {applied.value})")
+            else:
+                log(f"  Could not complete application. Skipping.")
+
+            # Stay on the results list; just make sure the modal is gone.
+            if driver.find_elements(*MODAL_CONTENT_CSS):
+                _close_modal(driver)
+
+        if page_num >= MAX_PAGES_PER_KEYWORD:
+            log("Reached max pages for this keyword.")
+            break
+        if not _go_to_next_results_page(driver):
+            log("No next page of results.")
+            break
+
+    return applied.value
 
-        success = process_easy_apply_modal(driver)
-        if success:
-            applied_count += 1
-            log(f"  *** APPLIED SUCCESSFULLY *** (Total: {applied_count})")
-        else:
-            log(f"  Could not complete application. Skipping.")
 
-        # Go back to search results
-        driver.get(url)
-        time.sleep(2)
-        # Re-fetch job indices since page reloaded
-        job_indices_new = get_easy_apply_jobs(driver)
-        log(f"  Back to search. {len(job_indices_new)} Easy Apply jobs remaining.")
+# Set in each worker process by _init_keyword_worker().
+_WORKER_APPLIED = None
 
-    return applied_count
+
+def _init_keyword_worker(applied) -> None:
+    """Pool initializer: hand the worker the shared applied counter."""
+    global _WORKER_APPLIED
+    _WORKER_APPLIED = applied
+
+
+def _apply_keyword_in_own_browser(job) -> None:
+    """Worker: open a dedicated Chrome (own profile dir), log in, apply for one keyword."""
+    i, keyword = job
+    if _WORKER_APPLIED.value >= MAX_APPLICATIONS:
+        return
+    driver = None
+    try:
+        # Stable per-keyword profile, so a manual login/verification only happens once.
+        # Created inside the try: a Chrome that fails to start (locked profile, driver
+        # mismatch) must not propagate through pool.map and drop the other keywords.
+        driver = create_driver(f"{PROFILE_DIR}_{i}")
+        login(driver)
+        apply_to_jobs(driver, keyword, _WORKER_APPLIED)
+    except Exception as e:
+        log(f"\nERROR in worker for '{keyword}': {e}")
+        log(traceback.format_exc())
+        if driver is not None:
+            screenshot(driver, "worker_error")
+    finally:
+        if driver is not None:
+            driver.quit()
+
+
+def apply_keywords_in_parallel(applied) -> int:
+    """Run one Chrome per keyword, at most PARALLEL_BROWSERS at a time."""
+    workers = max(1, min(PARALLEL_BROWSERS, len(KEYWORDS)))
+    log(f"Running {workers} browsers in parallel.")
+    with multiprocessing.Pool(
+        processes=workers,
+        initializer=_init_keyword_worker,
+        initargs=(applied,),
+    ) as pool:
+        pool.map(_apply_keyword_in_own_browser, list(enumerate(KEYWORDS)), chunksize=1)
+    return applied.value
 
 
 def main():
@@ -680,30 +980,47 @@ def main():
     log(f"Max applications: {MAX_APPLICATIONS}")
     log("=" * 60)
 
-    driver = create_driver()
-    applied_count = 0
+    applied = multiprocessing.Value("i", 0)
+
+    if PARALLEL_BROWSERS > 1 and len(KEYWORDS) > 1:
+        try:
+            apply_keywords_in_parallel(applied)
+        except KeyboardInterrupt:
+            log("\nStopped by user.")
+        log(f"\n{'='*60}")
+        log(f"DONE! Applied to {applied.value} jobs.")
+        log(f"{'='*60}")
+        return
+
+    driver = create_driver(PROFILE_DIR)
+    interrupted = False
 
     try:
         login(driver)
 
         for keyword in KEYWORDS:
-            if applied_count >= MAX_APPLICATIONS:
+            if applied.value >= MAX_APPLICATIONS:
                 break
-            applied_count = apply_to_jobs(driver, keyword, applied_count)
+            apply_to_jobs(driver, keyword, applied)
 
         log(f"\n{'='*60}")
-        log(f"DONE! Applied to {applied_count} jobs.")
+        log(f"DONE! Applied to {applied.value} jobs.")
         log(f"{'='*60}")
 
     except KeyboardInterrupt:
+        interrupted = True
         log("\nStopped by user.")
     except Exception as e:
         log(f"\nFATAL ERROR: {e}")
         log(traceback.format_exc())
         screenshot(driver, "fatal_error")
     finally:
-        log("Done. Browser stays open for 5 minutes then closes.")
-        time.sleep(300)
+        # Set KEEP_BROWSER_OPEN=1 to inspect the final page before Chrome closes.
+        if os.getenv("KEEP_BROWSER_OPEN") and not interrupted:
+            try:
+                input("Browser left open for inspection. Press Enter to close...")
+            except (EOFError, KeyboardInterrupt):
+                pass
         driver.quit()
 
 
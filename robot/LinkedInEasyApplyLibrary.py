@@ -1,13 +1,19 @@
 """Robot Framework library for LinkedIn Easy Apply (Australia Data Engineer)."""
 from __future__ import annotations
 
+import json
+import multiprocessing
+import multiprocessing.util
 import os
-import time
+import threading
 from datetime import datetime
+from functools import lru_cache
 from typing import List
+from urllib.parse import quote_plus
 
 from robot.api import logger
 from robot.libraries.BuiltIn import BuiltIn
+from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
@@ -16,21 +22,104 @@ from selenium.common.exceptions import (
     TimeoutException,
     ElementClickInterceptedException,
     StaleElementReferenceException,
+    WebDriverException,
 )
 
 SCREENSHOT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "..", "logs", "screenshots")
 
 
+# Browser owned by this process when running as an apply_to_jobs_parallel worker,
+# or why the worker could not start one; plus the shared applications counter and cap.
+_WORKER_DRIVER = None
+_WORKER_ERROR = ""
+_WORKER_APPLIED = None
+_WORKER_CAP = 0
+
+
 def _driver():
+    """
+    The browser to drive: this worker's own, else SeleniumLibrary's. This library
+    probes optional elements with find_elements and waits explicitly, so it expects
+    no implicit wait (LinkedInKeywords.robot imports SeleniumLibrary with implicit_wait=0).
+    """
+    if _WORKER_DRIVER is not None:
+        return _WORKER_DRIVER
     return BuiltIn().get_library_instance("SeleniumLibrary").driver
 
 
-def _wait(timeout=10):
-    return WebDriverWait(_driver(), timeout)
+def _wait(timeout=10, poll=0.2):
+    """Explicit wait on the current driver, ignoring stale elements while polling."""
+    return WebDriverWait(
+        _driver(), timeout, poll_frequency=poll,
+        ignored_exceptions=(StaleElementReferenceException,),
+    )
+
+
+def _wait_clickable(xpaths: List[str], timeout=5, poll=0.2):
+    """Wait until any of the XPaths is clickable; return that element or None on timeout."""
+    try:
+        return _wait(timeout, poll).until(
+            EC.any_of(*(EC.element_to_be_clickable((By.XPATH, xp)) for xp in xpaths))
+        )
+    except TimeoutException:
+        return None
+
+
+def _wait_until_gone(element, timeout=2) -> None:
+    """Wait for an element to be replaced/removed (the modal moved on), at most `timeout` s."""
+    if element is None:
+        return
+    try:
+        _wait(timeout, 0.1).until(EC.staleness_of(element))
+    except TimeoutException:
+        pass
+
+
+MODAL_XPATH = "//div[contains(@class,'jobs-easy-apply-content') or contains(@class,'jobs-easy-apply-modal')]"
+# Container of the Easy Apply dialog; generic "next"-style matches are scoped to it
+# because an unscoped union would also hit the results list's pagination buttons.
+MODAL_SCOPE_XPATH = "//div[contains(@class,'jobs-easy-apply-modal') or contains(@class,'artdeco-modal')]"
+MODAL_PRIMARY_BUTTON_XPATH = "//div[contains(@class,'jobs-easy-apply')]//button[contains(@class,'artdeco-button--primary')]"
+# Button locators, most specific first. EASY_APPLY_XPATHS are tried one at a time,
+# in order (a union returns page order); the generic entries exclude the search
+# page's "Easy Apply" filter pill, which sits above the job details pane.
+EASY_APPLY_XPATHS = (
+    "//button[contains(@class,'jobs-apply-button') and contains(@aria-label, 'Easy')]",
+    "//button[contains(@aria-label, 'Easy Apply') and not(contains(@class,'artdeco-pill'))]",
+    "//button[.//span[contains(text(),'Easy Apply')] and not(contains(@class,'artdeco-pill'))]",
+)
+SUBMIT_XPATHS = (
+    "//button[contains(., 'Submit application')]",
+    "//button[@aria-label='Submit application']",
+)
+CONTINUE_XPATHS = (
+    "//button[@aria-label='Continue to next step']",
+    "//button[contains(., 'Continue to next step')]",
+    "//button[@aria-label='Review your application']",
+    "//button[contains(., 'Review your application')]",
+    MODAL_SCOPE_XPATH + "//button[contains(@aria-label, 'next')]",
+    MODAL_SCOPE_XPATH + "//button[contains(@aria-label, 'Next')]",
+    MODAL_SCOPE_XPATH + "//button[span[text()='Next']]",
+    MODAL_SCOPE_XPATH + "//button[contains(., 'Next')]",
+    MODAL_SCOPE_XPATH + "//button[span[contains(text(),'Next')]]",
+    MODAL_SCOPE_XPATH + "//footer//button[contains(@class,'artdeco-button--primary')]",
+    "//div[contains(@class,'jobs-easy-apply')]//button[contains(@class,'artdeco-button--primary')]",
+)
+# Union queries built once; _click_btn resolves each with a single script call.
+SUBMIT_XPATH_UNION = " | ".join(SUBMIT_XPATHS)
+CONTINUE_XPATH_UNION = " | ".join(CONTINUE_XPATHS)
+
+
+# Screenshots left for this run; only taken when ROBOT_DEBUG is set.
+_SHOT_BUDGET = 5
 
 
 def _screenshot(driver, label: str = "debug") -> None:
-    """Save a screenshot for debugging."""
+    """Save a debugging screenshot (ROBOT_DEBUG only, at most _SHOT_BUDGET per run)."""
+    global _SHOT_BUDGET
+    if not os.environ.get("ROBOT_DEBUG") or _SHOT_BUDGET <= 0:
+        return
+    _SHOT_BUDGET -= 1
     try:
         os.makedirs(SCREENSHOT_DIR, exist_ok=True)
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -41,21 +130,41 @@ def _screenshot(driver, label: str = "debug") -> None:
         logger.warn(f"Could not save screenshot: {e}")
 
 
+def _cdp_eval(driver, expression: str):
+    """
+    Evaluate a JS expression over CDP (Runtime.evaluate, returnByValue) and return
+    its value. Skips WebDriver's script wrapping and element-reference marshalling.
+    """
+    response = driver.execute_cdp_cmd("Runtime.evaluate", {
+        "expression": expression,
+        "returnByValue": True,
+    })
+    if "exceptionDetails" in response:
+        raise RuntimeError(response["exceptionDetails"].get("text", "JS evaluation failed"))
+    return response.get("result", {}).get("value")
+
+
 def _log_page_buttons(driver, context: str = "") -> None:
-    """Log all visible buttons on page for debugging."""
+    """Log all visible buttons on page for debugging (ROBOT_VERBOSE only)."""
+    if not os.environ.get("ROBOT_VERBOSE"):
+        return
     try:
-        buttons = driver.find_elements(By.TAG_NAME, "button")
-        visible_btns = []
-        for b in buttons:
-            try:
-                if b.is_displayed():
-                    text = (b.text or "").strip()[:60]
-                    aria = (b.get_attribute("aria-label") or "").strip()[:60]
-                    classes = (b.get_attribute("class") or "").strip()[:80]
-                    if text or aria:
-                        visible_btns.append(f"  text='{text}' aria='{aria}' class='{classes}'")
-            except StaleElementReferenceException:
-                continue
+        buttons = _cdp_eval(driver, """
+            Array.prototype.filter.call(document.querySelectorAll('button'), function (b) {
+                return b.offsetParent !== null;
+            }).map(function (b) {
+                return [
+                    (b.innerText || '').trim().slice(0, 60),
+                    (b.getAttribute('aria-label') || '').trim().slice(0, 60),
+                    (b.getAttribute('class') || '').trim().slice(0, 80)
+                ];
+            })
+        """) or []
+        visible_btns = [
+            f"  text='{text}' aria='{aria}' class='{classes}'"
+            for text, aria, classes in buttons
+            if text or aria
+        ]
         if visible_btns:
             logger.info(f"[{context}] Visible buttons ({len(visible_btns)}):\n" + "\n".join(visible_btns[:20]))
         else:
@@ -65,20 +174,21 @@ def _log_page_buttons(driver, context: str = "") -> None:
 
 
 def get_easy_apply_card_indices() -> List[int]:
-    """Return 0-based indices of job cards that show Easy Apply and not Applied."""
+    """Return 0-based indices of job cards that show Easy Apply and not Applied (one JS scan)."""
     driver = _driver()
-    cards = driver.find_elements(By.XPATH, "//li[@data-occludable-job-id]")
-    indices = []
-    for i, card in enumerate(cards):
-        try:
-            text = (card.text or "").lower()
-            if "applied" in text or "see application" in text:
-                continue
-            if "easy apply" in text:
-                indices.append(i)
-        except Exception:
-            continue
-    return indices
+    indices = _cdp_eval(driver, """
+        (function () {
+            var cards = document.querySelectorAll('li[data-occludable-job-id]');
+            var out = [];
+            for (var i = 0; i < cards.length; i++) {
+                var t = (cards[i].innerText || '').toLowerCase();
+                if (t.indexOf('applied') !== -1 || t.indexOf('see application') !== -1) continue;
+                if (t.indexOf('easy apply') !== -1) out.push(i);
+            }
+            return out;
+        })()
+    """)
+    return list(indices or [])
 
 
 def click_job_card_by_index(index: int) -> None:
@@ -88,34 +198,36 @@ def click_job_card_by_index(index: int) -> None:
     if index >= len(cards):
         raise ValueError(f"Job card index {index} out of range (max {len(cards) - 1})")
     card = cards[index]
+    job_id = card.get_attribute("data-occludable-job-id")
     try:
         link = card.find_element(By.TAG_NAME, "a")
     except NoSuchElementException:
         raise
     driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", link)
-    time.sleep(0.5)
     try:
         link.click()
     except ElementClickInterceptedException:
         driver.execute_script("arguments[0].click();", link)
-    time.sleep(2)
+    # The detail pane follows currentJobId in the URL.
+    try:
+        _wait(5).until(EC.url_contains(f"currentJobId={job_id}"))
+    except TimeoutException:
+        logger.warn(f"Job {job_id} details did not load within 5s.")
 
 
 def easy_apply_button_present() -> bool:
     """True if the main apply control is Easy Apply (not external)."""
-    driver = _driver()
-    selectors = [
-        "//button[contains(@class,'jobs-apply-button') and contains(@class, 'artdeco-button--3') and contains(@aria-label, 'Easy')]",
-        "//button[contains(@aria-label, 'Easy Apply')]",
-        "//button[.//span[contains(text(),'Easy Apply')]]",
-    ]
-    for xp in selectors:
-        try:
-            el = driver.find_element(By.XPATH, xp)
-            return el.is_displayed()
-        except NoSuchElementException:
-            continue
-    return False
+    return bool(_driver().execute_script("""
+        var xpaths = arguments[0];
+        for (var x = 0; x < xpaths.length; x++) {
+            var hits = document.evaluate(xpaths[x], document, null,
+                                         XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var i = 0; i < hits.snapshotLength; i++) {
+                if (hits.snapshotItem(i).getClientRects().length) return true;
+            }
+        }
+        return false;
+    """, list(EASY_APPLY_XPATHS)))
 
 
 def _js_click_button(driver, button_texts: List[str]) -> str:
@@ -155,167 +267,206 @@ def _scroll_modal_down(driver) -> None:
             "//div[contains(@class,'jobs-easy-apply')]",
         ]
         for xp in modal_containers:
-            try:
-                container = driver.find_element(By.XPATH, xp)
-                driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", container)
-                time.sleep(0.5)
+            containers = driver.find_elements(By.XPATH, xp)
+            if containers:
+                # scrollTop is applied synchronously; nothing to wait for.
+                driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", containers[0])
                 return
-            except NoSuchElementException:
-                continue
         # Fallback: scroll the whole page down a bit
         driver.execute_script("window.scrollBy(0, 300);")
-        time.sleep(0.3)
     except Exception as e:
         logger.warn(f"Could not scroll modal: {e}")
 
 
-def _click_btn(driver, xpaths: List[str]) -> bool:
-    for xp in xpaths:
+def _click_btn(driver, xpath: str):
+    """
+    Click the first displayed, enabled button matching the XPath (usually one of the
+    *_XPATH_UNION constants). Lookup, scroll and click run in one script call.
+    Returns the clicked element or None.
+    """
+    return driver.execute_script("""
+        var hits = document.evaluate(arguments[0], document, null,
+                                     XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var i = 0; i < hits.snapshotLength; i++) {
+            var el = hits.snapshotItem(i);
+            if (el.disabled || el.getClientRects().length === 0) continue;
+            el.scrollIntoView({block: 'center'});
+            el.click();
+            return el;
+        }
+        return null;
+    """, xpath)
+
+
+def _click_advance_button(driver):
+    """Click Submit if shown, else Next/Continue/Review. Returns ("submit" | "continue", element) or None."""
+    clicked = _click_btn(driver, SUBMIT_XPATH_UNION)
+    if clicked:
+        return "submit", clicked
+    clicked = _click_btn(driver, CONTINUE_XPATH_UNION)
+    if clicked:
+        return "continue", clicked
+    return None
+
+
+def _try_advance(driver, timeout=0.8) -> str:
+    """
+    Move the modal forward one step: probe Submit/Continue, and on a miss scroll the
+    modal once and poll for up to `timeout` s for a button to render. After a
+    Continue click, waits for the step to be replaced. Returns "submit", "continue" or "".
+    """
+    result = _click_advance_button(driver)
+    if result is None:
+        _scroll_modal_down(driver)
         try:
-            el = driver.find_element(By.XPATH, xp)
-            # Scroll element into view first, even if not currently visible
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el)
-            time.sleep(0.3)
-            if not el.is_enabled():
-                continue
-            try:
-                el.click()
-            except ElementClickInterceptedException:
-                driver.execute_script("arguments[0].click();", el)
-            return True
-        except NoSuchElementException:
-            continue
-    return False
+            result = _wait(timeout, 0.1).until(_click_advance_button)
+        except TimeoutException:
+            return ""
+    kind, clicked = result
+    if kind == "continue":
+        _wait_until_gone(clicked)
+    return kind
 
 
-def _fill_form_fields(driver) -> bool:
-    """Fill empty required form fields in the Easy Apply modal. Returns True if anything was filled."""
-    filled = False
+# Required fields of the Easy Apply form, in the order _plan_form_fields indexes them.
+FORM_FIELDS_CSS = (
+    "div[class*='jobs-easy-apply'] input[required], div[class*='jobs-easy-apply'] textarea[required], "
+    "div[class*='jobs-easy-apply'] select[required], div[class*='jobs-easy-apply'] fieldset"
+)
+# (label regex, answer) for text/number inputs; first match wins, else INPUT_DEFAULT.
+INPUT_RULES = (
+    ("year|experience", "5"),
+    ("city|location", "Melbourne"),
+    ("salary|pay|rate", "120000"),
+    ("phone|mobile", "0400000000"),
+)
+INPUT_DEFAULT = "5"
+TEXTAREA_ANSWER = "I have extensive experience in this area and am keen to contribute to your team."
 
-    # 1. Fill empty required text/number inputs (e.g. years of experience, city)
-    try:
-        inputs = driver.find_elements(
-            By.XPATH,
-            "//div[contains(@class,'jobs-easy-apply')]//input[@required and (@type='text' or @type='number' or not(@type))]",
-        )
-        for inp in inputs:
-            try:
-                if not (inp.get_attribute("value") or "").strip():
-                    label_text = ""
-                    try:
-                        label_id = inp.get_attribute("id")
-                        if label_id:
-                            label_el = driver.find_element(By.XPATH, f"//label[@for='{label_id}']")
-                            label_text = (label_el.text or "").lower()
-                    except Exception:
-                        pass
-                    inp.clear()
-                    if "year" in label_text or "experience" in label_text:
-                        inp.send_keys("5")
-                    elif "city" in label_text or "location" in label_text:
-                        inp.send_keys("Melbourne")
-                    elif "salary" in label_text or "pay" in label_text or "rate" in label_text:
-                        inp.send_keys("120000")
-                    elif "phone" in label_text or "mobile" in label_text:
-                        inp.send_keys("0400000000")
-                    else:
-                        inp.send_keys("5")
-                    filled = True
-                    time.sleep(0.3)
-            except Exception:
-                continue
-    except Exception:
-        pass
 
-    # 2. Fill empty required textareas
-    try:
-        textareas = driver.find_elements(
-            By.XPATH,
-            "//div[contains(@class,'jobs-easy-apply')]//textarea[@required]",
-        )
-        for ta in textareas:
-            try:
-                if not (ta.get_attribute("value") or "").strip():
-                    ta.clear()
-                    ta.send_keys("I have extensive experience in this area and am keen to contribute to your team.")
-                    filled = True
-                    time.sleep(0.3)
-            except Exception:
-                continue
-    except Exception:
-        pass
+def _plan_form_fields(driver) -> list:
+    """
+    Scan the modal in one JS call and decide what each empty required field gets.
+    Returns [{'index', 'tag', 'label', 'value'}, ...]: value is text for inputs and
+    textareas, the option index for selects and the radio position for fieldsets.
+    """
+    result = driver.execute_script("""
+        function text(el) { return ((el && (el.innerText || el.textContent)) || '').trim(); }
+        var rules = arguments[1].map(function (r) { return [new RegExp(r[0]), r[1]]; });
+        var nodes = document.querySelectorAll(arguments[0]);
+        var plan = [];
+        for (var i = 0; i < nodes.length; i++) {
+            var el = nodes[i];
+            var tag = el.tagName.toLowerCase();
+            // Only fields the user could fill: skip disabled and hidden (unrendered) ones.
+            if (el.disabled || !el.getClientRects().length) continue;
+            if (tag === 'fieldset') {
+                var radios = el.querySelectorAll("input[type='radio']");
+                if (!radios.length) continue;
+                if (Array.prototype.some.call(radios, function (r) { return r.checked; })) continue;
+                var pick = 0;
+                for (var r = 0; r < radios.length; r++) {
+                    var sib = radios[r].nextElementSibling;
+                    var lbl = (sib && sib.tagName === 'LABEL') ? sib :
+                        (radios[r].parentElement ? radios[r].parentElement.querySelector('label') : null);
+                    if (text(lbl).toLowerCase().indexOf('yes') !== -1) { pick = r; break; }
+                }
+                plan.push({index: i, tag: tag, label: text(el.querySelector('legend')).toLowerCase(), value: pick});
+                continue;
+            }
+            if ((el.value || '').trim()) continue;
+            // Native .labels needs no extra query; label[for] covers fields outside a <form>.
+            var label = (el.labels && el.labels[0]) ||
+                (el.id ? document.querySelector('label[for="' + CSS.escape(el.id) + '"]') : null);
+            var labelText = text(label).toLowerCase();
+            if (tag === 'select') {
+                var idx = -1;
+                for (var o = 0; o < el.options.length; o++) {
+                    if (text(el.options[o]).toLowerCase() === 'yes') { idx = o; break; }
+                }
+                if (idx < 0 && el.options.length > 1) idx = 1;
+                if (idx >= 0) plan.push({index: i, tag: tag, label: labelText, value: idx});
+            } else if (tag === 'textarea') {
+                plan.push({index: i, tag: tag, label: labelText, value: arguments[3]});
+            } else {
+                var type = (el.getAttribute('type') || '').toLowerCase();
+                if (el.hasAttribute('type') && type !== 'text' && type !== 'number') continue;
+                var value = arguments[2];
+                for (var k = 0; k < rules.length; k++) {
+                    if (rules[k][0].test(labelText)) { value = rules[k][1]; break; }
+                }
+                plan.push({index: i, tag: tag, label: labelText, value: value});
+            }
+        }
+        return JSON.stringify(plan);
+    """, FORM_FIELDS_CSS, [list(r) for r in INPUT_RULES], INPUT_DEFAULT, TEXTAREA_ANSWER)
+    return json.loads(result or "[]")
+
+
+def _apply_form_plan(driver, plan: list) -> None:
+    """Write every planned value in one JS call, firing input/change so LinkedIn registers them."""
+    driver.execute_script("""
+        // Go through the prototype's value setter: React tracks the instance property and
+        // would otherwise treat the write as its own and drop the input event.
+        function setValue(el, value) {
+            Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set.call(el, value);
+        }
+        var nodes = document.querySelectorAll(arguments[0]);
+        var plan = arguments[1];
+        for (var p = 0; p < plan.length; p++) {
+            var el = nodes[plan[p].index];
+            if (!el) continue;
+            if (plan[p].tag === 'fieldset') {
+                var radio = el.querySelectorAll("input[type='radio']")[plan[p].value];
+                if (radio) radio.click();
+                continue;
+            }
+            if (plan[p].tag === 'select') el.selectedIndex = plan[p].value;
+            else setValue(el, plan[p].value);
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+    """, FORM_FIELDS_CSS, plan)
 
-    # 3. Handle required select dropdowns that haven't been selected
-    try:
-        selects = driver.find_elements(
-            By.XPATH,
-            "//div[contains(@class,'jobs-easy-apply')]//select[@required]",
-        )
-        for sel in selects:
-            try:
-                from selenium.webdriver.support.ui import Select
-                select = Select(sel)
-                current_val = sel.get_attribute("value") or ""
-                if not current_val or current_val == "":
-                    options = select.options
-                    # Pick the first non-placeholder option (often index 1)
-                    for opt in options:
-                        val = opt.get_attribute("value") or ""
-                        text = (opt.text or "").strip().lower()
-                        if val and text and text != "select an option" and text != "select" and text != "--":
-                            # Prefer "Yes" if available
-                            pass
-                        continue
-                    # Try to select "Yes" first
-                    yes_found = False
-                    for opt in options:
-                        if (opt.text or "").strip().lower() == "yes":
-                            select.select_by_visible_text(opt.text.strip())
-                            yes_found = True
-                            filled = True
-                            break
-                    if not yes_found and len(options) > 1:
-                        select.select_by_index(1)
-                        filled = True
-                    time.sleep(0.3)
-            except Exception:
-                continue
-    except Exception:
-        pass
 
-    # 4. Handle radio buttons (pick first option or "Yes")
-    try:
-        fieldsets = driver.find_elements(
-            By.XPATH,
-            "//div[contains(@class,'jobs-easy-apply')]//fieldset[.//input[@type='radio']]",
-        )
-        for fs in fieldsets:
-            try:
-                radios = fs.find_elements(By.XPATH, ".//input[@type='radio']")
-                any_checked = any(r.is_selected() for r in radios)
-                if not any_checked and radios:
-                    # Try "Yes" first
-                    clicked = False
-                    for r in radios:
-                        try:
-                            label = r.find_element(By.XPATH, "./following-sibling::label | ../label")
-                            if "yes" in (label.text or "").lower():
-                                driver.execute_script("arguments[0].click();", r)
-                                clicked = True
-                                filled = True
-                                break
-                        except Exception:
-                            continue
-                    if not clicked:
-                        driver.execute_script("arguments[0].click();", radios[0])
-                        filled = True
-                    time.sleep(0.3)
-            except Exception:
-                continue
-    except Exception:
-        pass
+def _form_signature(driver) -> str:
+    """
+    Identify the form fields (FORM_FIELDS_CSS) currently rendered in the Easy Apply
+    modal by id, falling back to name/tag; changes when a new step renders.
+    """
+    return driver.execute_script("""
+        return Array.prototype.map.call(
+            document.querySelectorAll(arguments[0]),
+            function (el) { return el.id || el.name || el.tagName; }
+        ).join('|');
+    """, FORM_FIELDS_CSS) or ""
 
-    return filled
+
+def _fill_if_new_form(driver, filled_sig):
+    """
+    Run _fill_form_fields unless the modal still shows the form last filled
+    (signature `filled_sig`). Returns the new form's signature if anything was
+    filled, else None.
+    """
+    sig = _form_signature(driver)
+    if sig == filled_sig:
+        logger.info("Form unchanged since last fill, not refilling.")
+        return None
+    return sig if _fill_form_fields(driver) else None
+
+
+def _fill_form_fields(driver) -> bool:
+    """Fill empty required form fields in the Easy Apply modal (one JS read, one JS write). Returns True if anything was filled."""
+    try:
+        plan = _plan_form_fields(driver)
+        for item in plan:
+            logger.info(f"Filling {item['tag']} '{item['label'][:60]}' -> {item['value']!r}")
+        if plan:
+            _apply_form_plan(driver, plan)
+        return bool(plan)
+    except (WebDriverException, ValueError) as e:
+        logger.warn(f"Could not fill form fields: {e}")
+        return False
 
 
 def try_easy_apply_and_submit() -> bool:
@@ -324,128 +475,69 @@ def try_easy_apply_and_submit() -> bool:
     Submit application -> click; Done -> click. Return True if submitted.
     """
     driver = _driver()
-    for xp in [
-        "//button[contains(@class,'jobs-apply-button') and contains(@aria-label, 'Easy')]",
-        "//button[contains(@aria-label, 'Easy Apply')]",
-        "//button[.//span[contains(text(),'Easy Apply')]]",
-    ]:
-        try:
-            btn = driver.find_element(By.XPATH, xp)
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", btn)
-            time.sleep(0.5)
-            try:
-                btn.click()
-            except ElementClickInterceptedException:
-                driver.execute_script("arguments[0].click();", btn)
-            logger.info("Clicked Easy Apply button.")
-            break
-        except NoSuchElementException:
-            continue
-    else:
+    if not any(_click_btn(driver, xp) is not None for xp in EASY_APPLY_XPATHS):
         logger.warn("Could not find Easy Apply button to click.")
         return False
+    logger.info("Clicked Easy Apply button.")
 
-    time.sleep(3)
-    _screenshot(driver, "after_easy_apply_click")
+    try:
+        _wait(5).until(EC.presence_of_element_located((By.XPATH, MODAL_XPATH)))
+    except TimeoutException:
+        logger.warn("Easy Apply modal did not appear within 5s.")
     _log_page_buttons(driver, "after_easy_apply_click")
 
     submitted = False
     max_steps = 25
-
-    submit_xpaths = [
-        "//button[contains(., 'Submit application')]",
-        "//button[@aria-label='Submit application']",
-    ]
-    continue_xpaths = [
-        "//button[@aria-label='Continue to next step']",
-        "//button[contains(., 'Continue to next step')]",
-        "//button[@aria-label='Review your application']",
-        "//button[contains(., 'Review your application')]",
-        "//button[contains(@aria-label, 'next')]",
-        "//button[contains(@aria-label, 'Next')]",
-        "//button[span[text()='Next']]",
-        "//button[contains(., 'Next')]",
-        "//button[span[contains(text(),'Next')]]",
-        "//footer//button[contains(@class,'artdeco-button--primary')]",
-        "//div[contains(@class,'jobs-easy-apply')]//button[contains(@class,'artdeco-button--primary')]",
-    ]
+    # Signature of the last form _fill_form_fields ran on; the same form is not refilled.
+    filled_sig = None
 
     for step in range(max_steps):
         logger.info(f"Easy Apply modal step {step + 1}/{max_steps}")
 
-        # Scroll down inside the modal to reveal buttons below the fold
-        _scroll_modal_down(driver)
-
-        # Check for Submit application button first
-        if _click_btn(driver, submit_xpaths):
+        advanced = _try_advance(driver)
+        if advanced == "submit":
             logger.info("Clicked 'Submit application'.")
             submitted = True
-            time.sleep(3)
             break
-
-        # Check for Next / Continue / Review buttons
-        if _click_btn(driver, continue_xpaths):
+        if advanced:
             logger.info(f"Clicked next/continue button at step {step + 1}.")
-            time.sleep(2)
-            continue
-
-        # Buttons not found yet - scroll modal down further and retry
-        logger.info(f"Buttons not visible at step {step + 1}, scrolling modal down and retrying...")
-        _scroll_modal_down(driver)
-        time.sleep(0.5)
-
-        if _click_btn(driver, submit_xpaths):
-            logger.info("Clicked 'Submit application' after scroll.")
-            submitted = True
-            time.sleep(3)
-            break
-
-        if _click_btn(driver, continue_xpaths):
-            logger.info(f"Clicked next/continue after scroll at step {step + 1}.")
-            time.sleep(2)
             continue
 
         # JavaScript fallback: find button by span text content and click it
+        primary = driver.find_elements(By.XPATH, MODAL_PRIMARY_BUTTON_XPATH)
         js_clicked = _js_click_button(driver, ["Next", "Continue to next step", "Review your application", "Submit application"])
         if js_clicked:
             clicked_text = js_clicked
             logger.info(f"JS fallback clicked '{clicked_text}' at step {step + 1}.")
             if "submit" in clicked_text.lower():
                 submitted = True
-                time.sleep(3)
                 break
-            time.sleep(2)
+            _wait_until_gone(primary[0] if primary else None)
             continue
 
-        # Try filling form fields, then scroll and retry clicking next
+        # Try filling form fields, then retry clicking next
         logger.info(f"No button found at step {step + 1}. Trying to fill form fields...")
         _screenshot(driver, f"step_{step+1}_stuck")
 
-        if _fill_form_fields(driver):
-            logger.info(f"Filled form fields at step {step + 1}, scrolling down and retrying next button.")
-            time.sleep(1)
-            _scroll_modal_down(driver)
-            time.sleep(0.5)
-            if _click_btn(driver, continue_xpaths):
-                logger.info(f"Clicked next/continue after filling fields at step {step + 1}.")
-                time.sleep(2)
-                continue
-            if _click_btn(driver, submit_xpaths):
+        sig = _fill_if_new_form(driver, filled_sig)
+        if sig is not None:
+            filled_sig = sig
+            logger.info(f"Filled form fields at step {step + 1}, retrying next button.")
+            advanced = _try_advance(driver)
+            if advanced == "submit":
                 logger.info("Clicked 'Submit application' after filling fields.")
                 submitted = True
-                time.sleep(3)
                 break
+            if advanced:
+                logger.info(f"Clicked next/continue after filling fields at step {step + 1}.")
+                continue
 
         # Check if a dismiss/close/discard dialog appeared (e.g. unsaved changes)
-        try:
-            discard_btn = driver.find_element(By.XPATH, "//button[contains(., 'Discard')]")
-            if discard_btn.is_displayed():
-                logger.warn("Discard dialog detected, clicking Discard.")
-                discard_btn.click()
-                time.sleep(1)
-                break
-        except NoSuchElementException:
-            pass
+        discard_btns = driver.find_elements(By.XPATH, "//button[contains(., 'Discard')]")
+        if discard_btns and discard_btns[0].is_displayed():
+            logger.warn("Discard dialog detected, clicking Discard.")
+            discard_btns[0].click()
+            break
 
         logger.warn(f"No actionable button found at step {step + 1}, breaking.")
         _screenshot(driver, f"step_{step+1}_no_action")
@@ -461,7 +553,7 @@ def try_easy_apply_and_submit() -> bool:
             except ElementClickInterceptedException:
                 driver.execute_script("arguments[0].click();", done)
             logger.info("Clicked 'Done' after submission.")
-            time.sleep(2)
+            _wait_until_gone(done, timeout=3)
         except TimeoutException:
             try:
                 driver.find_element(By.XPATH, "//button[@aria-label='Dismiss']").click()
@@ -474,28 +566,192 @@ def try_easy_apply_and_submit() -> bool:
         try:
             close_btn = driver.find_element(By.XPATH, "//button[@aria-label='Dismiss']")
             close_btn.click()
-            time.sleep(1)
-            try:
-                discard_btn = driver.find_element(By.XPATH, "//button[contains(., 'Discard')]")
+            discard_btn = _wait_clickable(["//button[contains(., 'Discard')]"], timeout=2)
+            if discard_btn is not None:
                 discard_btn.click()
-                time.sleep(1)
-            except NoSuchElementException:
-                pass
+                _wait_until_gone(discard_btn)
         except NoSuchElementException:
             pass
 
     return submitted
 
 
+def get_easy_apply_job_urls() -> List[str]:
+    """Return job view URLs of the Easy Apply (not yet applied) cards on the results page."""
+    driver = _driver()
+    ids = _cdp_eval(driver, """
+        (function () {
+            var cards = document.querySelectorAll('li[data-occludable-job-id]');
+            var out = [];
+            for (var i = 0; i < cards.length; i++) {
+                var t = (cards[i].innerText || '').toLowerCase();
+                if (t.indexOf('applied') !== -1 || t.indexOf('see application') !== -1) continue;
+                if (t.indexOf('easy apply') !== -1) out.push(cards[i].getAttribute('data-occludable-job-id'));
+            }
+            return out;
+        })()
+    """) or []
+    return [f"https://www.linkedin.com/jobs/view/{job_id}/" for job_id in ids]
+
+
+# Longest a parallel job may take before the pool is given up on, and how long
+# closing workers (quitting their Chrome) may take before they are terminated.
+PARALLEL_JOB_TIMEOUT = 300
+PARALLEL_SHUTDOWN_TIMEOUT = 30
+
+
+def _init_parallel_worker(cookies: list, headless: bool, applied, cap: int) -> None:
+    """
+    Pool initializer: start this worker's own Chrome and sign it in with the primary
+    session's cookies. Errors are recorded, not raised: a failing initializer makes
+    Pool respawn the worker forever and the map would never return.
+    """
+    global _WORKER_DRIVER, _WORKER_ERROR, _WORKER_APPLIED, _WORKER_CAP
+    _WORKER_APPLIED = applied
+    _WORKER_CAP = cap
+    driver = None
+    try:
+        options = webdriver.ChromeOptions()
+        if headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1920,1080")
+        else:
+            options.add_argument("--start-maximized")
+        options.page_load_strategy = "eager"
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        driver = webdriver.Chrome(options=options)
+        # Cookies can only be set for the domain currently loaded.
+        driver.get("https://www.linkedin.com")
+    except Exception as e:
+        _WORKER_ERROR = f"{type(e).__name__}: {e}"
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        return
+    for cookie in cookies:
+        try:
+            driver.add_cookie(cookie)
+        except WebDriverException:
+            pass  # e.g. a cookie for another LinkedIn subdomain
+    _WORKER_DRIVER = driver
+    # Quit the browser when the worker exits after Pool.close()/join().
+    multiprocessing.util.Finalize(driver, driver.quit, exitpriority=10)
+
+
+def _reserve_application_slot() -> bool:
+    """Count an application before it is attempted; False once the cap is taken."""
+    with _WORKER_APPLIED.get_lock():
+        if _WORKER_APPLIED.value >= _WORKER_CAP:
+            return False
+        _WORKER_APPLIED.value += 1
+        return True
+
+
+def _release_application_slot() -> None:
+    """Give back a slot reserved for an application that was not submitted."""
+    with _WORKER_APPLIED.get_lock():
+        _WORKER_APPLIED.value -= 1
+
+
+def _apply_to_job_url(job_url: str) -> tuple:
+    """
+    Open one job in this worker's browser and run the Easy Apply flow on it.
+    Returns (job_url, status, detail) with status APPLIED, SKIP or ERROR: a spawned
+    worker has no Robot context, so the parent logs the outcome.
+    """
+    if _WORKER_DRIVER is None:
+        return job_url, "ERROR", f"worker has no browser ({_WORKER_ERROR})"
+    submitted = False
+    reserved = False
+    try:
+        _WORKER_DRIVER.get(job_url)
+        if not _wait_clickable([
+            "//button[contains(@class,'jobs-apply-button')]",
+            "//button[contains(@aria-label, 'Easy Apply')]",
+        ], timeout=10):
+            return job_url, "SKIP", "no Easy Apply button"
+        if not _reserve_application_slot():
+            return job_url, "SKIP", "max applications reached"
+        reserved = True
+        submitted = try_easy_apply_and_submit()
+        return job_url, ("APPLIED" if submitted else "SKIP"), ("" if submitted else "Easy Apply flow did not complete")
+    except Exception as e:
+        return job_url, "ERROR", f"{type(e).__name__}: {e}"
+    finally:
+        if reserved and not submitted:
+            _release_application_slot()
+
+
+def _shut_down_pool(pool) -> None:
+    """Close the pool so workers quit their Chrome; terminate it if that hangs."""
+    pool.close()
+    joiner = threading.Thread(target=pool.join, daemon=True)
+    joiner.start()
+    joiner.join(PARALLEL_SHUTDOWN_TIMEOUT)
+    if joiner.is_alive():
+        logger.warn(f"Parallel workers did not exit within {PARALLEL_SHUTDOWN_TIMEOUT}s; terminating them.")
+        pool.terminate()
+
+
+def apply_to_jobs_parallel(job_urls: List[str], n: int = 3, max_applications: int = None,
+                           browser: str = None) -> int:
+    """
+    Apply to the given job URLs with `n` worker processes, each driving its own Chrome
+    signed in with the current browser's cookies. Workers reuse their browser across
+    the jobs they are assigned, share a counter so at most `max_applications` are
+    submitted, and run headless when `browser` (default: the suite's ${BROWSER}) is
+    headlesschrome. Logs each job's outcome; returns the number submitted.
+    """
+    job_urls = list(job_urls)
+    cap = len(job_urls) if max_applications is None else int(max_applications)
+    if not job_urls or cap <= 0:
+        return 0
+    n = max(1, min(int(n), len(job_urls)))
+    if browser is None:
+        browser = BuiltIn().get_variable_value("${BROWSER}", "chrome")
+    headless = str(browser).lower().startswith("headless")
+    cookies = _driver().get_cookies()
+    # spawn on every platform: a forked worker would inherit Robot's output files.
+    ctx = multiprocessing.get_context("spawn")
+    applied = ctx.Value("i", 0)
+    pool = ctx.Pool(n, initializer=_init_parallel_worker, initargs=(cookies, headless, applied, cap))
+    submitted = 0
+    timed_out = False
+    try:
+        results = pool.imap_unordered(_apply_to_job_url, job_urls, chunksize=1)
+        for _ in job_urls:
+            job_url, status, detail = results.next(timeout=PARALLEL_JOB_TIMEOUT)
+            if status == "APPLIED":
+                submitted += 1
+                logger.info(f"LinkedIn: applied (Easy Apply): {job_url}")
+            else:
+                logger.warn(f"LinkedIn: {status} {job_url}: {detail}")
+    except multiprocessing.TimeoutError:
+        logger.warn(f"No parallel job finished within {PARALLEL_JOB_TIMEOUT}s; terminating the workers.")
+        timed_out = True
+    finally:
+        if timed_out:
+            pool.terminate()
+        else:
+            _shut_down_pool(pool)
+    logger.info(f"Parallel Easy Apply: {submitted}/{len(job_urls)} submitted with {n} browsers.")
+    return submitted
+
+
 def go_back_to_search(search_url: str) -> None:
-    """Navigate back to the search results page."""
+    """Navigate back to the search results page and wait for the job cards."""
     _driver().get(search_url)
-    time.sleep(2)
+    try:
+        _wait(5).until(EC.presence_of_element_located((By.CSS_SELECTOR, "li[data-occludable-job-id]")))
+    except TimeoutException:
+        logger.warn("Search results did not load within 5s.")
 
 
+@lru_cache(maxsize=32)
 def build_search_url(keywords: str, location: str) -> str:
-    """Build LinkedIn jobs search URL with Easy Apply filter."""
-    from urllib.parse import quote_plus
+    """Build LinkedIn jobs search URL with Easy Apply filter (memoized per keywords/location)."""
     kw = quote_plus(keywords)
     loc = quote_plus(location)
     return f"https://www.linkedin.com/jobs/search/?keywords={kw}&location={loc}&f_AL=true&sortBy=R"
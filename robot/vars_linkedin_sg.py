@@ -24,6 +24,8 @@ LINKEDIN_LOGIN = "https://www.linkedin.com/login"
 KEYWORDS = ["data engineer"]
 LOCATION = "Singapore"
 MAX_APPLICATIONS = 10
+# >1 applies to each results page in that many extra Chrome windows (robot -v PARALLEL_BROWSERS:3)
+PARALLEL_BROWSERS = 1
 # Override via robot -v BROWSER:headlesschrome for scheduled/headless runs
 BROWSER = "chrome"
 
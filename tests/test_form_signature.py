@@ -0,0 +1,54 @@
+"""Easy Apply form filling is skipped only while the same form is still shown."""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("robot.api")
+pytest.importorskip("selenium")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "robot"))
+import LinkedInEasyApplyLibrary as lib  # noqa: E402
+
+
+class FakeDriver:
+    """Answers _form_signature's script with the field ids of the current step."""
+
+    def __init__(self, field_ids):
+        self.field_ids = field_ids
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        return "|".join(self.field_ids)
+
+
+@pytest.fixture
+def fills(monkeypatch):
+    calls = []
+    monkeypatch.setattr(lib, "_fill_form_fields", lambda driver: calls.append(driver) or True)
+    return calls
+
+
+def test_signature_uses_form_fields_scope():
+    driver = FakeDriver(["q1", "q2"])
+    assert lib._form_signature(driver) == "q1|q2"
+    _, args = driver.scripts[0]
+    assert args == (lib.FORM_FIELDS_CSS,)
+    assert "[class*='jobs-easy-apply']" in lib.FORM_FIELDS_CSS
+
+
+def test_same_form_is_not_refilled(fills):
+    driver = FakeDriver(["q1", "q2"])
+    filled_sig = lib._fill_if_new_form(driver, None)
+    assert filled_sig == "q1|q2"
+    assert lib._fill_if_new_form(driver, filled_sig) is None
+    assert len(fills) == 1
+
+
+def test_new_step_with_different_fields_is_filled(fills):
+    driver = FakeDriver(["q1", "q2"])
+    filled_sig = lib._fill_if_new_form(driver, None)
+    driver.field_ids = ["q3"]
+    assert lib._fill_if_new_form(driver, filled_sig) == "q3"
+    assert len(fills) == 2